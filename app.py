@@ -4,7 +4,6 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import json
 import os
-import asyncio
 from datetime import datetime
 import logging
 import re
@@ -14,6 +13,7 @@ from search.trending import TopicSearchScheduler, TrendingStorage
 from search.ai import AIRecommender, AISuggestionScheduler
 from search.manager import SearchManager
 from search.social import TwitterAPIv2
+from search.async_loop import run_async, get_background_loop
 
 app = Flask(__name__)
 
@@ -251,12 +251,9 @@ def search():
         
         # Use real search manager
         if search_manager:
-            # Run async search in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Run async search on the shared background loop
             try:
-                search_results = loop.run_until_complete(search_manager.search(query, max_results=10))
-                loop.close()
+                search_results = run_async(search_manager.search(query, max_results=10))
                 
                 # Convert search results to JSON format with sanitization
                 results = []
@@ -270,7 +267,6 @@ def search():
                 
                 return jsonify({"results": results, "query": query})
             except Exception as e:
-                loop.close()
                 logger.error(f"Search error: {e}")
                 return jsonify({"error": "Search failed"}), 500
         else:
@@ -326,6 +322,36 @@ def get_trending_articles():
         articles = []
         seen_urls = set()
         
+        # Serve the scheduler's precomputed snapshot when there is a fresh one
+        snapshot = storage.get_latest_articles_snapshot()
+        if snapshot:
+            if snapshot['etag'] in request.if_none_match:
+                response = app.response_class(status=304)
+                response.set_etag(snapshot['etag'])
+                return response
+            
+            for article in snapshot['articles']:
+                articles.append({
+                    "title": validate_and_sanitize_input(article['title'], 200),
+                    "url": validate_and_sanitize_input(article['url'], 500),
+                    "description": validate_and_sanitize_input(article['description'], 300),
+                    "source": validate_and_sanitize_input(article['source'], 50),
+                    "topic": validate_and_sanitize_input(article['topic'], 200),
+                    "score": article['score']
+                })
+                seen_urls.add(article['url'])
+            
+            for mock_article in MOCK_TRENDING_ARTICLES:
+                if len(articles) >= 5:
+                    break
+                if mock_article['url'] not in seen_urls:
+                    articles.append(mock_article)
+                    seen_urls.add(mock_article['url'])
+            
+            response = jsonify({"articles": articles[:5], "generated_at": snapshot['generated_at']})
+            response.set_etag(snapshot['etag'])
+            return response
+        
         # Try to get real trending topics from database
         trending_topics = []
         try:
@@ -346,40 +372,29 @@ def get_trending_articles():
         
         # Try to get real search results if search_manager is available
         if search_manager:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
-                for topic_result in trending_topics:
-                    if len(articles) >= 5:
-                        break
-                    
-                    topic = topic_result.topic
-                    try:
-                        # Search for articles about this topic
-                        search_results = loop.run_until_complete(
-                            search_manager.search(topic, max_results=3)
-                        )
-                        
-                        # Add unique articles to list
-                        if search_results and hasattr(search_results, 'results'):
-                            for result in search_results.results:
-                                if result.url not in seen_urls and len(articles) < 5:
-                                    articles.append({
-                                        "title": validate_and_sanitize_input(result.title, 200),
-                                        "url": validate_and_sanitize_input(result.url, 500),
-                                        "description": validate_and_sanitize_input(result.snippet, 300),
-                                        "source": validate_and_sanitize_input(result.source, 50),
-                                        "topic": validate_and_sanitize_input(topic, 200),
-                                        "score": int(topic_result.score * 100) if hasattr(topic_result, 'score') else 75
-                                    })
-                                    seen_urls.add(result.url)
-                    except Exception as e:
-                        logger.warning(f"Error searching for topic '{topic}': {e}")
-                        continue
+                topic_scores = {
+                    topic_result.topic: int(topic_result.score * 100) if hasattr(topic_result, 'score') else 75
+                    for topic_result in trending_topics
+                }
+                
+                # Search all topics concurrently; stops as soon as 5 unique articles are in
+                topic_articles = run_async(
+                    search_manager.search_topics(list(topic_scores), max_results=3, limit=5)
+                )
+                
+                for topic, result in topic_articles:
+                    articles.append({
+                        "title": validate_and_sanitize_input(result.title, 200),
+                        "url": validate_and_sanitize_input(result.url, 500),
+                        "description": validate_and_sanitize_input(result.snippet, 300),
+                        "source": validate_and_sanitize_input(result.source, 50),
+                        "topic": validate_and_sanitize_input(topic, 200),
+                        "score": topic_scores[topic]
+                    })
+                    seen_urls.add(result.url)
             except Exception as e:
-                logger.warning(f"Error in search loop: {e}")
-            finally:
-                loop.close()
+                logger.warning(f"Error searching trending topics: {e}")
         
         # If we don't have enough real articles, use mock articles
         if len(articles) < 5:
@@ -898,7 +913,7 @@ def initialize_scheduler():
             'max_results_per_search': 50
         }
 
-        scheduler = TopicSearchScheduler(config)
+        scheduler = TopicSearchScheduler(config, search_manager=search_manager)
         scheduler.start()
         logger.info("Topic search scheduler initialized and started")
     except Exception as e:
@@ -920,4 +935,10 @@ if __name__ == '__main__':
         if scheduler:
             scheduler.stop()
         if ai_scheduler:
-            ai_scheduler.stop()
\ No newline at end of file
+            ai_scheduler.stop()
+        if search_manager:
+            try:
+                run_async(search_manager.close(), timeout=5)
+            except Exception as e:
+                logger.warning(f"Error closing search manager: {e}")
+        get_background_loop().shutdown()
\ No newline at end of file
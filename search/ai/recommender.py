@@ -5,7 +5,6 @@ AI-powered topic recommender using OpenAI and Gemini APIs
 
 import json
 import logging
-import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -20,6 +19,7 @@ from ..trending.storage import TrendingStorage
 from ..trending.models import AISuggestion, AISuggestionBatch
 from ..engines import SearchEngineManager
 from ..social import XAnalyzer
+from ..async_loop import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -329,11 +329,8 @@ class AISuggestionScheduler:
             batch = AISuggestionBatch(batch_id=batch_id, status='running')
             self.recommender.storage.save_ai_suggestion_batch(batch)
 
-            # Generate suggestions
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            suggestions = loop.run_until_complete(self.recommender.generate_suggestions(batch_id))
-            loop.close()
+            # Generate suggestions on the shared background loop
+            suggestions = run_async(self.recommender.generate_suggestions(batch_id))
 
             # Save suggestions
             saved_count = self.recommender.save_suggestions(suggestions, batch_id)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Long-lived background event loop for running coroutines from sync code
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+class BackgroundEventLoop:
+    """Event loop hosted on a daemon thread, shared by Flask routes and scheduler jobs"""
+
+    def __init__(self, name: str = "async-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the running loop, starting the thread on first use"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start()
+            return self._loop
+
+    def _start(self) -> None:
+        """Start the loop thread and wait until it is running"""
+        ready = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+            # Let cancelled tasks unwind before closing
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+        self._loop = loop
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        logger.info(f"Background event loop '{self.name}' started")
+
+    def submit(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the background loop and block until it finishes"""
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("submit() cannot be called from the background loop thread")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except Exception:
+            # Covers timeouts as well: don't leave the coroutine running
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the loop and join its thread"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout)
+            self._loop = None
+            self._thread = None
+            logger.info(f"Background event loop '{self.name}' stopped")
+
+
+_background_loop = BackgroundEventLoop()
+atexit.register(_background_loop.shutdown)
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Get the process-wide background event loop"""
+    return _background_loop
+
+def run_async(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the process-wide background loop from sync code"""
+    return _background_loop.submit(coro, timeout)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Result cache for aggregated search results with pluggable backends
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Optional
+from .models import AggregatedResults, SearchResult, EngineStatus
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+def serialize_results(results: AggregatedResults) -> str:
+    """Serialize aggregated results to JSON"""
+    data = asdict(results)
+    data['timestamp'] = results.timestamp.isoformat()
+    return json.dumps(data)
+
+def deserialize_results(payload: str) -> AggregatedResults:
+    """Rebuild aggregated results from JSON"""
+    data = json.loads(payload)
+    return AggregatedResults(
+        query=data['query'],
+        results=[SearchResult(**item) for item in data['results']],
+        total_results=data['total_results'],
+        timestamp=datetime.fromisoformat(data['timestamp']),
+        engine_statuses=[EngineStatus(**item) for item in data.get('engine_statuses', [])]
+    )
+
+class CacheBackend(ABC):
+    """Base class for search cache backends"""
+
+    # Backends doing network I/O are called from a worker thread inside coroutines
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[AggregatedResults]:
+        """Get a cached entry, or None if missing or expired"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: AggregatedResults, ttl: float) -> None:
+        """Store an entry for ttl seconds"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[AggregatedResults]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: AggregatedResults, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class RedisCacheBackend(CacheBackend):
+    """Redis-compatible cache backend; eviction follows the server's maxmemory-policy"""
+
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "search:", timeout: Optional[float] = None):
+        import redis
+
+        self.prefix = prefix
+        # Short timeouts so an unreachable server degrades to cache misses
+        timeout = timeout or Config.SEARCH_CACHE_TIMEOUT
+        self.client = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+
+    def get(self, key: str) -> Optional[AggregatedResults]:
+        payload = self.client.get(self.prefix + key)
+        if payload is None:
+            return None
+        return deserialize_results(payload)
+
+    def set(self, key: str, value: AggregatedResults, ttl: float) -> None:
+        self.client.set(self.prefix + key, serialize_results(value), ex=max(1, int(ttl)))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+class SearchCache:
+    """TTL cache for aggregated search results with hit/miss accounting"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = None):
+        self.backend = backend if backend is not None else MemoryCacheBackend(Config.SEARCH_CACHE_MAX_ENTRIES)
+        self.ttl = ttl or Config.SEARCH_CACHE_TTL
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls) -> "SearchCache":
+        """Build a cache using the backend configured by SEARCH_CACHE_URL"""
+        backend = None
+        if Config.SEARCH_CACHE_URL:
+            try:
+                backend = RedisCacheBackend(Config.SEARCH_CACHE_URL)
+                logger.info("Search cache using Redis backend")
+            except Exception as e:
+                logger.warning(f"Redis search cache not available, using in-process cache: {e}")
+        return cls(backend=backend)
+
+    def get(self, key: str) -> Optional[AggregatedResults]:
+        """Look up a cached result, counting hits and misses"""
+        return self._count(self._lookup(key))
+
+    async def get_async(self, key: str) -> Optional[AggregatedResults]:
+        """Look up a cached result without blocking the event loop on a network backend"""
+        if self.backend.blocking:
+            return self._count(await asyncio.to_thread(self._lookup, key))
+        return self.get(key)
+
+    def _lookup(self, key: str) -> Optional[AggregatedResults]:
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Search cache lookup failed: {e}")
+            return None
+
+    def _count(self, value: Optional[AggregatedResults]) -> Optional[AggregatedResults]:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: AggregatedResults) -> None:
+        """Store a result for the configured TTL"""
+        try:
+            self.backend.set(key, value, self.ttl)
+        except Exception as e:
+            logger.warning(f"Search cache store failed: {e}")
+
+    async def set_async(self, key: str, value: AggregatedResults) -> None:
+        """Store a result without blocking the event loop on a network backend"""
+        if self.backend.blocking:
+            await asyncio.to_thread(self.set, key, value)
+        else:
+            self.set(key, value)
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.backend),
+            "evictions": getattr(self.backend, 'evictions', 0),
+            "ttl_seconds": self.ttl
+        }
@@ -38,9 +38,48 @@ class Config:
     TWITTER_API_SECRET: Optional[str] = os.getenv("TWITTER_API_SECRET")
     TWITTER_ACCESS_TOKEN: Optional[str] = os.getenv("TWITTER_ACCESS_TOKEN")
     TWITTER_ACCESS_TOKEN_SECRET: Optional[str] = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
+    TWITTER_MAX_RATE_LIMIT_WAIT: float = float(os.getenv("TWITTER_MAX_RATE_LIMIT_WAIT", "900"))
+    TWITTER_USER_ID_CACHE_PATH: str = os.getenv("TWITTER_USER_ID_CACHE_PATH", os.path.join("data", "twitter_user_ids.json"))
+    
+    # Search fan-out settings
+    SEARCH_FAN_OUT: bool = os.getenv("SEARCH_FAN_OUT", "true").lower() == "true"
+    SEARCH_ENGINE_TIMEOUT: float = float(os.getenv("SEARCH_ENGINE_TIMEOUT", "8.0"))
+    SEARCH_DEADLINE: float = float(os.getenv("SEARCH_DEADLINE", "10.0"))
+    
+    # Search result cache settings (SEARCH_CACHE_URL selects a Redis-compatible backend)
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL: float = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024"))
+    SEARCH_CACHE_URL: Optional[str] = os.getenv("SEARCH_CACHE_URL")
+    SEARCH_CACHE_TIMEOUT: float = float(os.getenv("SEARCH_CACHE_TIMEOUT", "0.5"))
+    
+    # DuckDuckGo worker pool settings
+    DDG_MAX_WORKERS: int = int(os.getenv("DDG_MAX_WORKERS", "4"))
+    DDG_TIMEOUT: float = float(os.getenv("DDG_TIMEOUT", "8.0"))
+    
+    # Pooled HTTP transport settings
+    HTTP_POOL_LIMIT: int = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+    HTTP_POOL_LIMIT_PER_HOST: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30.0"))
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+    HTTP_REQUEST_TIMEOUT: float = float(os.getenv("HTTP_REQUEST_TIMEOUT", "15.0"))
     
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///trends.db")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # Topics summarized per upsert chunk in batch summary updates
+    SUMMARY_BATCH_CHUNK_SIZE: int = int(os.getenv("SUMMARY_BATCH_CHUNK_SIZE", "500"))
+    # Raw engagement metrics are kept this long; older monthly partitions are dropped whole
+    ENGAGEMENT_METRICS_RETENTION_DAYS: int = int(os.getenv("ENGAGEMENT_METRICS_RETENTION_DAYS", "400"))
+    # Engagement metrics younger than this are left for the next rollup (ignored on SQLite)
+    ROLLUP_SAFETY_LAG_SECONDS: int = int(os.getenv("ROLLUP_SAFETY_LAG_SECONDS", "300"))
+    
+    # SQLite tuning applied to every connection (cache size in KiB, busy timeout in ms)
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
     
     # Trending settings
     TRENDING_THRESHOLD: float = float(os.getenv("TRENDING_THRESHOLD", "0.7"))
@@ -50,6 +89,21 @@ class Config:
     ENABLE_SOCIAL_MEDIA: bool = os.getenv("ENABLE_SOCIAL_MEDIA", "true").lower() == "true"
     X_TRENDING_LIMIT: int = int(os.getenv("X_TRENDING_LIMIT", "20"))
     
+    X_TRENDING_CACHE_TTL: float = float(os.getenv("X_TRENDING_CACHE_TTL", "300"))
+    # Shared analyzer history: database for warm starts (empty disables), or a JSON file without one
+    X_HISTORY_DATABASE_URL: str = os.getenv("X_HISTORY_DATABASE_URL", "sqlite:///trending_data.db")
+    X_HISTORY_PATH: Optional[str] = os.getenv("X_HISTORY_PATH")
+    
+    # Keyword taxonomy file (defaults to search/social/taxonomy.json), checked for changes every interval
+    SOCIAL_TAXONOMY_PATH: Optional[str] = os.getenv("SOCIAL_TAXONOMY_PATH")
+    SOCIAL_TAXONOMY_RELOAD_INTERVAL: float = float(os.getenv("SOCIAL_TAXONOMY_RELOAD_INTERVAL", "30"))
+    
+    # Headless browser pool settings for X.com scraping
+    X_DRIVER_POOL_SIZE: int = int(os.getenv("X_DRIVER_POOL_SIZE", "2"))
+    X_DRIVER_MAX_USES: int = int(os.getenv("X_DRIVER_MAX_USES", "50"))
+    X_DRIVER_IDLE_TIMEOUT: float = float(os.getenv("X_DRIVER_IDLE_TIMEOUT", "600"))
+    X_DRIVER_POOL_WARM: bool = os.getenv("X_DRIVER_POOL_WARM", "true").lower() == "true"
+    
     @classmethod
     def validate(cls) -> list[str]:
         """Validate that required API keys are set."""
@@ -2,6 +2,7 @@ from .base import BaseSearchEngine
 from .google import GoogleSearchEngine
 from .duckduckgo import DuckDuckGoSearchEngine
 from .bing import BingSearchEngine
+from .http import HTTPTransport
 
 class SearchEngineManager:
     """Manager for search engines"""
@@ -17,4 +18,4 @@ class SearchEngineManager:
         """Get a search engine by name"""
         return self.engines.get(name)
 
-__all__ = ['BaseSearchEngine', 'GoogleSearchEngine', 'DuckDuckGoSearchEngine', 'BingSearchEngine', 'SearchEngineManager']
+__all__ = ['BaseSearchEngine', 'GoogleSearchEngine', 'DuckDuckGoSearchEngine', 'BingSearchEngine', 'HTTPTransport', 'SearchEngineManager']
@@ -17,3 +17,7 @@ class BaseSearchEngine(ABC):
     async def search(self, query: str, max_results: int = 10) -> List[SearchResult]:
         """Search for results"""
         pass
+    
+    async def close(self) -> None:
+        """Release resources held by the engine"""
+        pass
@@ -4,24 +4,25 @@ Bing Search API implementation
 """
 
 import logging
-import aiohttp
-from typing import List
+from typing import List, Optional
 from .base import BaseSearchEngine
 from ..models import SearchResult
 from ..config import Config
+from .http import HTTPTransport
 
 logger = logging.getLogger(__name__)
 
 class BingSearchEngine(BaseSearchEngine):
     """Bing Search API integration"""
     
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         super().__init__("bing")
         if not Config.BING_API_KEY:
             raise ValueError("Bing API key is required")
         
         self.api_key = Config.BING_API_KEY
         self.base_url = "https://api.bing.microsoft.com/v7.0/search"
+        self.transport = transport or HTTPTransport()
     
     async def search(self, query: str, max_results: int = 10) -> List[SearchResult]:
         """Search using Bing Search API"""
@@ -35,28 +36,32 @@ class BingSearchEngine(BaseSearchEngine):
                 'count': min(max_results, 50)  # Bing API limit
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        results = []
-                        
-                        for item in data.get('webPages', {}).get('value', []):
-                            search_result = SearchResult(
-                                title=item.get('name', ''),
-                                url=item.get('url', ''),
-                                snippet=item.get('snippet', ''),
-                                source=self.name,
-                                rank=len(results) + 1
-                            )
-                            results.append(search_result)
-                        
-                        logger.info(f"Bing found {len(results)} results")
-                        return results
-                    else:
-                        logger.error(f"Bing API error: {response.status} - {await response.text()}")
-                        return []
-                        
+            session = self.transport.get_session()
+            async with session.get(self.base_url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    results = []
+                    
+                    for item in data.get('webPages', {}).get('value', []):
+                        search_result = SearchResult(
+                            title=item.get('name', ''),
+                            url=item.get('url', ''),
+                            snippet=item.get('snippet', ''),
+                            source=self.name,
+                            rank=len(results) + 1
+                        )
+                        results.append(search_result)
+                    
+                    logger.info(f"Bing found {len(results)} results")
+                    return results
+                else:
+                    logger.error(f"Bing API error: {response.status} - {await response.text()}")
+                    return []
+                    
         except Exception as e:
             logger.error(f"Bing search error: {e}")
             return []
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP session"""
+        await self.transport.close()
@@ -3,39 +3,81 @@
 DuckDuckGo search engine implementation
 """
 
+import asyncio
 import logging
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from .base import BaseSearchEngine
 from ..models import SearchResult
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
 class DuckDuckGoSearchEngine(BaseSearchEngine):
     """DuckDuckGo search engine implementation"""
-    
-    def __init__(self):
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None):
         super().__init__("duckduckgo")
-    
+        self.max_workers = max_workers or Config.DDG_MAX_WORKERS
+        self.timeout = timeout or Config.DDG_TIMEOUT
+
+        # The ddgs client is synchronous, so it runs on a dedicated bounded
+        # pool instead of blocking the event loop.
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ddgs")
+        self._local = threading.local()
+
+    def _get_client(self):
+        """Get the DDGS client owned by the current worker thread"""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            from ddgs import DDGS
+            client = DDGS(timeout=int(self.timeout))
+            self._local.client = client
+        return client
+
+    def _search_sync(self, query: str, max_results: int, cancelled: threading.Event) -> List[SearchResult]:
+        """Blocking DuckDuckGo search, executed on the worker pool"""
+        results = []
+        if cancelled.is_set():
+            return results
+
+        for result in self._get_client().text(query, max_results=max_results):
+            if cancelled.is_set():
+                break
+            search_result = SearchResult(
+                title=result.get('title', ''),
+                url=result.get('href', ''),
+                snippet=result.get('body', ''),
+                source=self.name,
+                rank=len(results) + 1
+            )
+            results.append(search_result)
+
+        return results
+
     async def search(self, query: str, max_results: int = 10) -> List[SearchResult]:
         """Search using DuckDuckGo"""
+        cancelled = threading.Event()
         try:
-            from ddgs import DDGS
-            
-            results = []
-            with DDGS() as ddgs:
-                for result in ddgs.text(query, max_results=max_results):
-                    search_result = SearchResult(
-                        title=result.get('title', ''),
-                        url=result.get('href', ''),
-                        snippet=result.get('body', ''),
-                        source=self.name,
-                        rank=len(results) + 1
-                    )
-                    results.append(search_result)
-            
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, self._search_sync, query, max_results, cancelled)
+            results = await asyncio.wait_for(future, timeout=self.timeout)
+
             logger.info(f"DuckDuckGo found {len(results)} results")
             return results
-            
+
+        except asyncio.TimeoutError:
+            cancelled.set()
+            logger.warning(f"DuckDuckGo search timed out after {self.timeout}s")
+            return []
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
         except Exception as e:
             logger.error(f"DuckDuckGo search error: {e}")
             return []
+
+    async def close(self) -> None:
+        """Shut down the worker pool"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP transport shared by the API-based search engines
+"""
+
+import asyncio
+import logging
+from typing import Optional, Set
+import aiohttp
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+class HTTPTransport:
+    """Long-lived aiohttp session with connection pooling, keep-alive and DNS caching"""
+    
+    def __init__(self, limit: Optional[int] = None, limit_per_host: Optional[int] = None,
+                 keepalive_timeout: Optional[float] = None, dns_cache_ttl: Optional[int] = None,
+                 request_timeout: Optional[float] = None):
+        self.limit = limit or Config.HTTP_POOL_LIMIT
+        self.limit_per_host = limit_per_host or Config.HTTP_POOL_LIMIT_PER_HOST
+        self.keepalive_timeout = keepalive_timeout or Config.HTTP_KEEPALIVE_TIMEOUT
+        self.dns_cache_ttl = dns_cache_ttl or Config.HTTP_DNS_CACHE_TTL
+        self.request_timeout = request_timeout or Config.HTTP_REQUEST_TIMEOUT
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use in the running loop"""
+        loop = asyncio.get_running_loop()
+        
+        if self._session is not None and self._loop is not loop:
+            # Sessions are bound to the loop they were created in; a loop
+            # switch means the old pool can no longer be used.
+            logger.debug("Event loop changed, closing pooled HTTP session")
+            self._close_stale_session(self._session, self._loop, loop)
+            self._session = None
+        
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+            self._loop = loop
+        
+        return self._session
+    
+    def _close_stale_session(self, session: aiohttp.ClientSession,
+                             old_loop: Optional[asyncio.AbstractEventLoop],
+                             loop: asyncio.AbstractEventLoop) -> None:
+        """Close a session left behind by a previous event loop, on that loop if it still runs"""
+        if session.closed:
+            return
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._close_session(session), old_loop)
+            return
+        # The old loop is stopped or closed: release the connector from the current loop
+        task = loop.create_task(self._close_session(session))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_session(session: aiohttp.ClientSession) -> None:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug(f"Error closing stale HTTP session: {e}")
+            # Still detach the connector so the session is not reported as unclosed
+            session.detach()
+
+    async def close(self) -> None:
+        """Close the pooled session and release its connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
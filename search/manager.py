@@ -5,14 +5,17 @@ Enhanced Search Manager with X.com social media integration (web scraping only)
 
 import logging
 import asyncio
+import re
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from .engines.base import BaseSearchEngine
 from .engines.google import GoogleSearchEngine
 from .engines.duckduckgo import DuckDuckGoSearchEngine
 from .engines.bing import BingSearchEngine
-from .models import SearchResult, AggregatedResults, AIRecommendation
+from .models import SearchResult, AggregatedResults, AIRecommendation, EngineStatus
 from .config import Config
+from .cache import SearchCache
 from .social.x_trending import XTrendingDetector
 from .social.x_analyzer import XTrendingAnalyzer
 
@@ -43,14 +46,30 @@ class SearchManager:
     """Enhanced Search Manager with X.com social media integration"""
     
     def __init__(self, enable_trending: bool = True, enable_ai: bool = True, 
-                 enable_social: bool = True, db_path: str = "trends.db"):
+                 enable_social: bool = True, db_path: str = "trends.db",
+                 fan_out: Optional[bool] = None, engine_timeout: Optional[float] = None,
+                 search_deadline: Optional[float] = None, cache: Optional[SearchCache] = None):
         self.enable_trending = enable_trending
         self.enable_ai = enable_ai
         self.enable_social = enable_social
         
+        # Fan-out settings: per-engine timeout and overall deadline in seconds
+        self.fan_out = Config.SEARCH_FAN_OUT if fan_out is None else fan_out
+        self.engine_timeout = engine_timeout or Config.SEARCH_ENGINE_TIMEOUT
+        self.search_deadline = search_deadline or Config.SEARCH_DEADLINE
+        
         # Initialize search engines
         self.search_engines = self._initialize_search_engines()
         
+        # Initialize result cache
+        self.search_cache = cache
+        if cache is None and Config.SEARCH_CACHE_ENABLED:
+            self.search_cache = SearchCache.from_config()
+        
+        # In-flight searches shared by identical concurrent queries
+        self._inflight_searches: Dict[str, asyncio.Task] = {}
+        self.coalesced_searches = 0
+        
         # Initialize AI recommender
         self.ai_recommender = None
         if enable_ai:
@@ -128,18 +147,103 @@ class SearchManager:
     
     async def search(self, query: str, max_results: int = 10) -> AggregatedResults:
         """Perform search across all available engines"""
-        logger.info(f"Searching for: {query}")
+        cache_key = self._cache_key(query, max_results)
         
-        all_results = []
+        if self.search_cache:
+            cached_results = await self.search_cache.get_async(cache_key)
+            if cached_results is not None:
+                logger.info(f"Cache hit for: {query}")
+                return cached_results
         
-        # Search with each engine
-        for engine in self.search_engines:
-            try:
-                results = await engine.search(query, max_results)
-                all_results.extend(results)
-                logger.info(f"Found {len(results)} results from {engine.name}")
-            except Exception as e:
-                logger.error(f"Error searching with {engine.name}: {e}")
+        # Single-flight: identical concurrent queries share one upstream fan-out
+        task = self._inflight_searches.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._search_and_cache(cache_key, query, max_results))
+            self._inflight_searches[cache_key] = task
+            task.add_done_callback(lambda done: self._release_inflight(cache_key, done))
+        else:
+            self.coalesced_searches += 1
+            logger.info(f"Joining in-flight search for: {query}")
+        
+        # Shield the shared task so one cancelled waiter doesn't cancel it for the rest
+        return await asyncio.shield(task)
+    
+    async def search_topics(self, topics: List[str], max_results: int = 3, limit: int = 5,
+                            deadline: Optional[float] = None) -> List[Tuple[str, SearchResult]]:
+        """Search several topics concurrently, stopping once `limit` unique results are collected"""
+        deadline = deadline or self.search_deadline
+        topic_order = {topic: index for index, topic in enumerate(topics)}
+        tasks = {asyncio.create_task(self.search(topic, max_results)): topic for topic in topics}
+        
+        collected = []
+        seen_urls = set()
+        loop = asyncio.get_running_loop()
+        ends_at = loop.time() + deadline
+        pending = set(tasks)
+        
+        try:
+            while pending and len(collected) < limit:
+                remaining = ends_at - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"Topic search deadline of {deadline}s reached with {len(pending)} topics pending")
+                    break
+                
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    topic = tasks[task]
+                    if task.exception():
+                        logger.warning(f"Error searching for topic '{topic}': {task.exception()}")
+                        continue
+                    for result in task.result().results:
+                        if result.url not in seen_urls and len(collected) < limit:
+                            collected.append((topic, result))
+                            seen_urls.add(result.url)
+        finally:
+            # Cancel whatever is still running once we have enough or ran out of time
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Keep results grouped in the caller's topic order
+        collected.sort(key=lambda item: topic_order[item[0]])
+        return collected
+    
+    def _release_inflight(self, cache_key: str, task: asyncio.Task) -> None:
+        """Forget a finished in-flight search"""
+        if self._inflight_searches.get(cache_key) is task:
+            del self._inflight_searches[cache_key]
+    
+    async def _search_and_cache(self, cache_key: str, query: str, max_results: int) -> AggregatedResults:
+        """Run an uncached search and store the outcome"""
+        aggregated_results = await self._search_uncached(query, max_results)
+        
+        # Don't pin a result for the whole TTL when every engine failed
+        if self.search_cache and any(status.status == "ok" for status in aggregated_results.engine_statuses):
+            await self.search_cache.set_async(cache_key, aggregated_results)
+        
+        return aggregated_results
+    
+    def _cache_key(self, query: str, max_results: int) -> str:
+        """Build a cache key from the normalized query, result limit and engine set"""
+        normalized_query = re.sub(r'\s+', ' ', query.strip().lower())
+        engine_names = ",".join(sorted(engine.name for engine in self.search_engines))
+        return f"{normalized_query}|{max_results}|{engine_names}"
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get search result cache statistics"""
+        if not self.search_cache:
+            return {"enabled": False, "coalesced_searches": self.coalesced_searches}
+        return {"enabled": True, "coalesced_searches": self.coalesced_searches, **self.search_cache.stats()}
+    
+    async def _search_uncached(self, query: str, max_results: int) -> AggregatedResults:
+        """Fan the query out to the search engines"""
+        logger.info(f"Searching for: {query}")
+        
+        if self.fan_out:
+            all_results, engine_statuses = await self._search_concurrently(query, max_results)
+        else:
+            all_results, engine_statuses = await self._search_sequentially(query, max_results)
         
         # Remove duplicates and sort by relevance
         unique_results = self._remove_duplicates(all_results)
@@ -150,11 +254,86 @@ class SearchManager:
             query=query,
             results=sorted_results[:max_results],
             total_results=len(sorted_results),
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            engine_statuses=engine_statuses
         )
         
         return aggregated_results
     
+    async def _search_sequentially(self, query: str, max_results: int) -> Tuple[List[SearchResult], List[EngineStatus]]:
+        """Search each engine one after another"""
+        all_results = []
+        engine_statuses = []
+        
+        for engine in self.search_engines:
+            results, status = await self._search_engine(engine, query, max_results)
+            all_results.extend(results)
+            engine_statuses.append(status)
+        
+        return all_results, engine_statuses
+    
+    async def _search_concurrently(self, query: str, max_results: int) -> Tuple[List[SearchResult], List[EngineStatus]]:
+        """Launch every engine at once and keep whatever arrives before the deadline"""
+        started = time.monotonic()
+        tasks = {
+            asyncio.create_task(self._search_engine(engine, query, max_results)): engine
+            for engine in self.search_engines
+        }
+        
+        done, pending = await asyncio.wait(tasks.keys(), timeout=self.search_deadline)
+        
+        # Cancel engines that missed the overall deadline
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        all_results = []
+        engine_statuses = []
+        for task, engine in tasks.items():
+            if task in done:
+                results, status = task.result()
+                all_results.extend(results)
+            else:
+                logger.warning(f"{engine.name} missed the {self.search_deadline}s search deadline")
+                status = EngineStatus(
+                    engine=engine.name,
+                    status="deadline_exceeded",
+                    elapsed_ms=(time.monotonic() - started) * 1000
+                )
+            engine_statuses.append(status)
+        
+        return all_results, engine_statuses
+    
+    async def _search_engine(self, engine: BaseSearchEngine, query: str,
+                             max_results: int) -> Tuple[List[SearchResult], EngineStatus]:
+        """Search a single engine within the per-engine timeout"""
+        started = time.monotonic()
+        try:
+            results = await asyncio.wait_for(engine.search(query, max_results), timeout=self.engine_timeout)
+            logger.info(f"Found {len(results)} results from {engine.name}")
+            return results, EngineStatus(
+                engine=engine.name,
+                status="ok",
+                result_count=len(results),
+                elapsed_ms=(time.monotonic() - started) * 1000
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"{engine.name} timed out after {self.engine_timeout}s")
+            return [], EngineStatus(
+                engine=engine.name,
+                status="timeout",
+                elapsed_ms=(time.monotonic() - started) * 1000
+            )
+        except Exception as e:
+            logger.error(f"Error searching with {engine.name}: {e}")
+            return [], EngineStatus(
+                engine=engine.name,
+                status="error",
+                elapsed_ms=(time.monotonic() - started) * 1000,
+                error=str(e)
+            )
+    
     async def search_with_social_trends(self, query: str, max_results: int = 10) -> Dict[str, Any]:
         """Perform search with X.com social media trends integration"""
         logger.info(f"Searching with social trends for: {query}")
@@ -288,6 +467,14 @@ class SearchManager:
             logger.error(f"Error getting trending analysis: {e}")
             return {}
     
+    async def close(self) -> None:
+        """Release pooled connections held by the search engines"""
+        for engine in self.search_engines:
+            try:
+                await engine.close()
+            except Exception as e:
+                logger.warning(f"Error closing {engine.name} search engine: {e}")
+    
     def _remove_duplicates(self, results: List[SearchResult]) -> List[SearchResult]:
         """Remove duplicate search results"""
         seen_urls = set()
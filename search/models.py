@@ -3,7 +3,7 @@
 Data models for the Search Agent
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
@@ -16,6 +16,15 @@ class SearchResult:
     source: str
     rank: int
 
+@dataclass
+class EngineStatus:
+    """Outcome of a single engine during a search fan-out"""
+    engine: str
+    status: str  # 'ok', 'timeout', 'error', 'deadline_exceeded'
+    result_count: int = 0
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
 @dataclass
 class AggregatedResults:
     """Aggregated search results"""
@@ -23,6 +32,7 @@ class AggregatedResults:
     results: List[SearchResult]
     total_results: int
     timestamp: datetime
+    engine_statuses: List[EngineStatus] = field(default_factory=list)
 
 @dataclass
 class AIRecommendation:
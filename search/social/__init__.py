@@ -1,6 +1,7 @@
 from .x_trending import XTrendingDetector
 from .x_analyzer import XTrendingAnalyzer
 from .twitter_api_v2 import TwitterAPIv2
+from .twitter_async import AsyncTwitterAPIv2
 
 class XAnalyzer:
     """X.com analyzer wrapper with Twitter API v2 integration"""
@@ -31,4 +32,4 @@ class XAnalyzer:
         """Get trending topics using Twitter API"""
         return self.twitter_api.get_trending_topics(woeid, limit)
 
-__all__ = ['XTrendingDetector', 'XTrendingAnalyzer', 'XAnalyzer', 'TwitterAPIv2']
+__all__ = ['XTrendingDetector', 'XTrendingAnalyzer', 'XAnalyzer', 'TwitterAPIv2', 'AsyncTwitterAPIv2']
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Pool of reusable headless Chrome drivers for X.com scraping
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """Create a headless Chrome driver configured for X.com scraping"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+    try:
+        return webdriver.Chrome(options=chrome_options)
+    except Exception as e:
+        logger.error(f"Failed to setup Chrome driver: {e}")
+        raise
+
+@dataclass
+class PooledDriver:
+    """A pooled driver and its usage bookkeeping"""
+    driver: webdriver.Chrome
+    uses: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+
+class WebDriverPool:
+    """Bounded pool of warm WebDriver instances with health checks and recycling"""
+
+    def __init__(self, factory: Callable[[], webdriver.Chrome] = create_chrome_driver,
+                 max_size: Optional[int] = None, max_uses: Optional[int] = None,
+                 idle_timeout: Optional[float] = None, checkout_timeout: float = 120.0):
+        self.factory = factory
+        self.max_size = max_size or Config.X_DRIVER_POOL_SIZE
+        self.max_uses = max_uses or Config.X_DRIVER_MAX_USES
+        self.idle_timeout = idle_timeout or Config.X_DRIVER_IDLE_TIMEOUT
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: List[PooledDriver] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self.created_count = 0
+        self.recycled_count = 0
+        self._warm_thread: Optional[threading.Thread] = None
+
+    def warm(self, count: int = 1) -> None:
+        """Start idle drivers ahead of the first checkout"""
+        count = min(count, self.max_size)
+        with self._lock:
+            missing = count - len(self._idle)
+        for _ in range(max(0, missing)):
+            if not self._slots.acquire(blocking=False):
+                break
+            try:
+                pooled = self._create()
+                with self._lock:
+                    self._idle.append(pooled)
+            except Exception as e:
+                logger.warning(f"Could not warm WebDriver pool: {e}")
+                break
+            finally:
+                self._slots.release()
+
+    def warm_in_background(self, count: int = 1) -> None:
+        """Warm the pool from a daemon thread so the caller does not wait for Chrome"""
+        with self._lock:
+            if self._warm_thread is not None and self._warm_thread.is_alive():
+                return
+            self._warm_thread = threading.Thread(target=self.warm, args=(count,), name="webdriver-pool-warm", daemon=True)
+            self._warm_thread.start()
+
+    @contextmanager
+    def checkout(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a healthy driver for the duration of the with-block"""
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise TimeoutError(f"No WebDriver available within {self.checkout_timeout}s")
+
+        pooled = None
+        failed = False
+        try:
+            pooled = self._acquire()
+            yield pooled.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if pooled is not None:
+                self._release(pooled, failed)
+            self._slots.release()
+
+    def close(self) -> None:
+        """Quit every idle driver"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
+
+    def stats(self) -> dict:
+        """Get pool counters for monitoring"""
+        with self._lock:
+            idle = len(self._idle)
+        return {
+            "max_size": self.max_size,
+            "idle": idle,
+            "created": self.created_count,
+            "recycled": self.recycled_count
+        }
+
+    def _create(self) -> PooledDriver:
+        driver = self.factory()
+        self.created_count += 1
+        logger.info("Started new pooled WebDriver")
+        return PooledDriver(driver=driver)
+
+    def _acquire(self) -> PooledDriver:
+        """Take an idle healthy driver or start a new one"""
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                return self._create()
+
+            if time.monotonic() - pooled.last_used_at > self.idle_timeout:
+                logger.debug("Recycling idle WebDriver")
+                self._quit(pooled)
+                continue
+            if not self._is_healthy(pooled):
+                logger.warning("Discarding unhealthy pooled WebDriver")
+                self._quit(pooled)
+                continue
+            return pooled
+
+    def _release(self, pooled: PooledDriver, failed: bool) -> None:
+        """Return a driver to the pool or retire it"""
+        pooled.uses += 1
+        pooled.last_used_at = time.monotonic()
+
+        if pooled.uses >= self.max_uses or (failed and not self._is_healthy(pooled)):
+            self._quit(pooled)
+            return
+
+        with self._lock:
+            self._idle.append(pooled)
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        try:
+            pooled.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        self.recycled_count += 1
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting WebDriver: {e}")
+
+
+_shared_pool: Optional[WebDriverPool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_shared_driver_pool() -> WebDriverPool:
+    """Get the process-wide WebDriver pool; no driver is started until it is warmed or checked out"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = WebDriverPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Time-bucketed rolling history of X.com trending data
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from ..config import Config
+from .topic_index import RelatedTopicIndex
+from .x_trending import XTrendingData
+
+logger = logging.getLogger(__name__)
+
+class HistoryEntry(NamedTuple):
+    """Compact tuple form of one XTrendingData record"""
+    topic: str
+    frequency: int
+    engagement_score: float
+    category: str
+    timestamp: float  # epoch seconds
+    source: str
+
+    @classmethod
+    def from_data(cls, data: XTrendingData) -> 'HistoryEntry':
+        return cls(
+            data.topic,
+            data.frequency,
+            data.engagement_score,
+            sys.intern(data.category),
+            data.timestamp.timestamp(),
+            sys.intern(data.source)
+        )
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'HistoryEntry':
+        return cls(
+            row['topic'],
+            row['frequency'] or 0,
+            row['engagement_score'] or 0.0,
+            sys.intern(row['category']),
+            row['timestamp'].timestamp(),
+            sys.intern(row['source'] or 'x.com')
+        )
+
+    def to_row(self) -> Dict[str, Any]:
+        return {
+            'topic': self.topic,
+            'frequency': self.frequency,
+            'engagement_score': self.engagement_score,
+            'category': self.category,
+            'source': self.source,
+            'timestamp': datetime.fromtimestamp(self.timestamp)
+        }
+
+    def to_data(self) -> XTrendingData:
+        return XTrendingData(
+            topic=self.topic,
+            frequency=self.frequency,
+            engagement_score=self.engagement_score,
+            category=self.category,
+            timestamp=datetime.fromtimestamp(self.timestamp),
+            source=self.source
+        )
+
+class TrendingHistory:
+    """Rolling window of trending data stored in fixed-width time buckets
+
+    Buckets are kept oldest first, so appending recent data is O(1) and expiry
+    drops whole buckets from the front, touching only the one bucket that
+    straddles the cutoff entry by entry. A related-topic index is kept in step
+    with the entries. With a TrendingStorage the history is warm-loaded from the
+    database and new entries are written through; a path persists it to JSON.
+    """
+
+    def __init__(self, retention: timedelta = timedelta(days=7), bucket_seconds: int = 3600,
+                 path: Optional[str] = None, storage=None):
+        self.retention = retention
+        self.bucket_seconds = bucket_seconds
+        self.path = path
+        self.storage = storage
+        self.related_index = RelatedTopicIndex()
+
+        self._buckets: Deque[Tuple[int, List[HistoryEntry]]] = deque()
+        self._size = 0
+        self._lock = threading.RLock()
+
+        if self.storage is not None:
+            self.load_from_storage()
+        elif self.path:
+            self.load()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[XTrendingData]:
+        with self._lock:
+            entries = [entry for _, bucket in self._buckets for entry in bucket]
+        for entry in entries:
+            yield entry.to_data()
+
+    def _bucket_key(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def append(self, data: XTrendingData) -> None:
+        """Add one record to its time bucket"""
+        self.extend([data])
+
+    def extend(self, items: Iterable[XTrendingData]) -> None:
+        """Add records and write them through to storage in one batch"""
+        entries = [HistoryEntry.from_data(data) for data in items]
+        with self._lock:
+            for entry in entries:
+                self._append_entry(entry)
+        if self.storage is not None and entries:
+            self.storage.save_history_entries([entry.to_row() for entry in entries])
+
+    def related_topics(self, topic: str, limit: int = 5) -> List[str]:
+        """Topics in the history that share the most weight with the given topic"""
+        with self._lock:
+            return self.related_index.related(topic, limit=limit)
+
+    def _append_entry(self, entry: HistoryEntry) -> None:
+        key = self._bucket_key(entry.timestamp)
+        self._size += 1
+        self.related_index.add(entry.topic)
+
+        if not self._buckets or key > self._buckets[-1][0]:
+            self._buckets.append((key, [entry]))
+            return
+        if key == self._buckets[-1][0]:
+            self._buckets[-1][1].append(entry)
+            return
+
+        # Out-of-order record: find or create its bucket, walking back from the newest
+        for index in range(len(self._buckets) - 1, -1, -1):
+            bucket_key, entries = self._buckets[index]
+            if bucket_key == key:
+                entries.append(entry)
+                return
+            if bucket_key < key:
+                self._buckets.insert(index + 1, (key, [entry]))
+                return
+        self._buckets.appendleft((key, [entry]))
+
+    def expire(self, now: Optional[datetime] = None) -> List[XTrendingData]:
+        """Drop records older than the retention window and return them"""
+        cutoff_time = (now or datetime.now()) - self.retention
+        cutoff = cutoff_time.timestamp()
+        cutoff_key = self._bucket_key(cutoff)
+        expired: List[HistoryEntry] = []
+
+        with self._lock:
+            while self._buckets and self._buckets[0][0] < cutoff_key:
+                expired.extend(self._buckets.popleft()[1])
+
+            if self._buckets and self._buckets[0][0] == cutoff_key:
+                key, entries = self._buckets[0]
+                kept = [entry for entry in entries if entry.timestamp >= cutoff]
+                if len(kept) < len(entries):
+                    expired.extend(entry for entry in entries if entry.timestamp < cutoff)
+                    if kept:
+                        self._buckets[0] = (key, kept)
+                    else:
+                        self._buckets.popleft()
+
+            self._size -= len(expired)
+            self.related_index.remove_many(entry.topic for entry in expired)
+
+        if self.storage is not None and expired:
+            self.storage.delete_history_before(cutoff_time)
+        return [entry.to_data() for entry in expired]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self.related_index.clear()
+            self._size = 0
+
+    def load_from_storage(self) -> int:
+        """Bulk-load the retention window from storage"""
+        since = datetime.now() - self.retention
+        rows = self.storage.load_history_entries(since)
+        with self._lock:
+            self.clear()
+            for row in rows:
+                self._append_entry(HistoryEntry.from_row(row))
+        logger.info(f"Warm-loaded {len(rows)} trending history records from storage")
+        return len(rows)
+
+    def save(self) -> bool:
+        """Write the history to the persistence file"""
+        if not self.path:
+            return False
+        try:
+            with self._lock:
+                rows = [list(entry) for _, entries in self._buckets for entry in entries]
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'bucket_seconds': self.bucket_seconds, 'entries': rows}, f)
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not save trending history to {self.path}: {e}")
+            return False
+
+    def load(self) -> int:
+        """Load history from the persistence file, dropping expired records"""
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            with self._lock:
+                self.clear()
+                for row in payload.get('entries', []):
+                    topic, frequency, engagement_score, category, timestamp, source = row
+                    self._append_entry(HistoryEntry(
+                        topic, frequency, engagement_score, sys.intern(category), timestamp, sys.intern(source)
+                    ))
+            self.expire()
+            logger.info(f"Loaded {self._size} trending history records from {self.path}")
+            return self._size
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not load trending history from {self.path}: {e}")
+            return 0
+
+
+_shared_history: Optional[TrendingHistory] = None
+_shared_history_lock = threading.Lock()
+
+def get_shared_history() -> TrendingHistory:
+    """Get the process-wide trending history shared by every analyzer"""
+    global _shared_history
+    with _shared_history_lock:
+        if _shared_history is None:
+            storage = None
+            if Config.X_HISTORY_DATABASE_URL:
+                try:
+                    # Imported lazily: the trending package imports this module's analyzer
+                    from ..trending.storage import TrendingStorage
+                    storage = TrendingStorage(Config.X_HISTORY_DATABASE_URL)
+                except Exception as e:
+                    logger.warning(f"Trending history storage not available: {e}")
+            _shared_history = TrendingHistory(
+                retention=timedelta(days=7),
+                path=Config.X_HISTORY_PATH,
+                storage=storage
+            )
+        return _shared_history
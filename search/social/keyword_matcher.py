@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Compiled multi-keyword matcher (Aho-Corasick) for tweet and topic classification
+"""
+
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_HASHTAG = re.compile(r'#(\w+)')
+# Word boundaries inside a run-together hashtag: camelCase, acronym-to-word and letter/digit changes
+_HASHTAG_SEGMENT = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|(?<=[^\W\d_])(?=\d)|(?<=\d)(?=[^\W\d_])')
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _hashtag_boundaries(text: str) -> Set[int]:
+    """Offsets inside hashtags where a run-together word starts, e.g. before 'Coding' in '#AICoding'"""
+    boundaries: Set[int] = set()
+    for hashtag in _HASHTAG.finditer(text):
+        offset = hashtag.start(1)
+        boundaries.update(offset + found.start() for found in _HASHTAG_SEGMENT.finditer(hashtag.group(1)))
+    return boundaries
+
+@dataclass
+class KeywordMatch:
+    """Keywords found in a text and the category they resolve to"""
+    keywords: List[str] = field(default_factory=list)
+    category: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a categorized keyword dictionary
+
+    Matching is case-insensitive and linear in the text length regardless of the
+    dictionary size. With word_boundary enabled a keyword only matches when it is
+    not directly preceded or followed by a letter, digit or underscore, so 'ai'
+    matches 'AI tools' and '#ai' but not 'email'. Inside hashtags the camelCase and
+    digit changes also count as boundaries, so '#AICoding' and '#100DaysOfCode'
+    match 'ai', 'coding' and 'code'. Aliases are reported under their
+    canonical keyword; per-category regex patterns are checked after the automaton.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]], word_boundary: bool = True,
+                 aliases: Optional[Mapping[str, Mapping[str, str]]] = None,
+                 patterns: Optional[Mapping[str, Iterable[str]]] = None):
+        aliases = aliases or {}
+        patterns = patterns or {}
+
+        # Category order is the priority order used to pick a text's category
+        self.category_order: List[str] = list(dict.fromkeys([*categories, *aliases, *patterns]))
+        self.word_boundary = word_boundary
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._keywords: List[str] = []
+        self._keyword_categories: List[Set[str]] = []
+        self._keyword_ids: Dict[str, int] = {}
+        self._canonical: List[str] = []
+
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                self._add(keyword.lower().strip(), category)
+        for category, category_aliases in aliases.items():
+            for alias, canonical in category_aliases.items():
+                self._add(alias.lower().strip(), category, canonical.lower().strip())
+        self._build_failure_links()
+
+        self._patterns: List[Tuple[str, re.Pattern]] = [
+            (category, re.compile(pattern, re.IGNORECASE))
+            for category, category_patterns in patterns.items()
+            for pattern in category_patterns
+        ]
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def _add(self, keyword: str, category: str, canonical: Optional[str] = None) -> None:
+        if not keyword:
+            return
+        if keyword in self._keyword_ids:
+            self._keyword_categories[self._keyword_ids[keyword]].add(category)
+            return
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        keyword_id = len(self._keywords)
+        self._keywords.append(keyword)
+        self._keyword_categories.append({category})
+        self._keyword_ids[keyword] = keyword_id
+        self._canonical.append(canonical or keyword)
+        self._output[state].append(keyword_id)
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first pass linking each state to its longest proper suffix state"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, str]]:
+        """Yield (start, keyword) for every dictionary keyword or alias occurrence, overlaps included"""
+        boundaries: Set[int] = set()
+        if self.word_boundary and '#' in text:
+            boundaries = _hashtag_boundaries(text)
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed offsets (e.g. dotted capital I); fall back to plain boundaries
+            boundaries = set()
+        text = lowered
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for keyword_id in self._output[state]:
+                keyword = self._keywords[keyword_id]
+                start = index - len(keyword) + 1
+                if self.word_boundary:
+                    if (start > 0 and start not in boundaries
+                            and _is_word_char(text[start - 1]) and _is_word_char(keyword[0])):
+                        continue
+                    if (index + 1 < len(text) and index + 1 not in boundaries
+                            and _is_word_char(text[index + 1]) and _is_word_char(keyword[-1])):
+                        continue
+                yield start, keyword
+
+    def match(self, text: str) -> KeywordMatch:
+        """Find the distinct keywords in a text and its highest-priority category in one pass"""
+        keywords: Dict[str, None] = {}
+        categories: Set[str] = set()
+        for _, keyword in self.iter_matches(text):
+            keyword_id = self._keyword_ids[keyword]
+            keywords[self._canonical[keyword_id]] = None
+            categories.update(self._keyword_categories[keyword_id])
+
+        for category, pattern in self._patterns:
+            found = pattern.search(text)
+            if found:
+                keywords[found.group(0).lower()] = None
+                categories.add(category)
+
+        category = next((name for name in self.category_order if name in categories), None)
+        return KeywordMatch(keywords=list(keywords), category=category)
+
+    def keywords(self, category: Optional[str] = None) -> Set[str]:
+        """Canonical dictionary keywords, optionally limited to one category"""
+        return {
+            self._canonical[keyword_id]
+            for keyword_id, categories in enumerate(self._keyword_categories)
+            if category is None or category in categories
+        }
+
+    def find_keywords(self, text: str) -> List[str]:
+        """Distinct keywords found in a text, in order of first occurrence"""
+        return self.match(text).keywords
+
+    def categorize(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """Highest-priority category matched by a text"""
+        return self.match(text).category or default
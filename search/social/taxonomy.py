@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Keyword taxonomy shared by the social media analyzers
+
+Categories, keywords, aliases and regex patterns live in a JSON file (taxonomy.json
+next to this module, or SOCIAL_TAXONOMY_PATH). Each taxonomy is compiled into a
+KeywordMatcher once, and the file is re-read when its modification time changes.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+from ..config import Config
+from .keyword_matcher import KeywordMatch, KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), 'taxonomy.json')
+
+@dataclass
+class CompiledTaxonomy:
+    """One named taxonomy compiled into a matcher"""
+    name: str
+    matcher: KeywordMatcher
+    default: Optional[str] = None
+
+def compile_taxonomies(data: Dict[str, Any]) -> Dict[str, CompiledTaxonomy]:
+    """Compile the taxonomies of a parsed taxonomy file"""
+    compiled = {}
+    for name, spec in data.get('taxonomies', {}).items():
+        categories = spec.get('categories', {})
+        matcher = KeywordMatcher(
+            {category: entry.get('keywords', []) for category, entry in categories.items()},
+            aliases={category: entry['aliases'] for category, entry in categories.items() if entry.get('aliases')},
+            patterns={category: entry['patterns'] for category, entry in categories.items() if entry.get('patterns')}
+        )
+        compiled[name] = CompiledTaxonomy(name=name, matcher=matcher, default=spec.get('default'))
+    return compiled
+
+class KeywordTaxonomy:
+    """Compiled keyword taxonomies, hot-reloaded when the taxonomy file changes"""
+
+    def __init__(self, path: Optional[str] = None, reload_interval: Optional[float] = None):
+        self.path = path or Config.SOCIAL_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH
+        self.reload_interval = reload_interval if reload_interval is not None else Config.SOCIAL_TAXONOMY_RELOAD_INTERVAL
+
+        self._taxonomies: Dict[str, CompiledTaxonomy] = {}
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+
+    def reload(self) -> bool:
+        """Re-read and recompile the taxonomy file; the previous index is kept on failure"""
+        with self._lock:
+            try:
+                mtime = os.path.getmtime(self.path)
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    taxonomies = compile_taxonomies(json.load(f))
+            except Exception as e:
+                logger.error(f"Failed to load keyword taxonomy from {self.path}: {e}")
+                return False
+
+            # Readers hold a reference to the old dict, so swapping it is safe
+            self._taxonomies = taxonomies
+            self._mtime = mtime
+            self._checked_at = time.monotonic()
+            logger.info(f"Loaded keyword taxonomy from {self.path} ({', '.join(taxonomies)})")
+            return True
+
+    def _reload_if_changed(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self.reload()
+
+    def get(self, name: str) -> CompiledTaxonomy:
+        """Get a compiled taxonomy by name"""
+        self._reload_if_changed()
+        try:
+            return self._taxonomies[name]
+        except KeyError:
+            raise KeyError(f"Unknown keyword taxonomy: {name}") from None
+
+    def match(self, name: str, text: str) -> KeywordMatch:
+        """Match a text against a taxonomy"""
+        return self.get(name).matcher.match(text)
+
+    def find_keywords(self, name: str, text: str) -> List[str]:
+        """Distinct taxonomy keywords found in a text"""
+        return self.get(name).matcher.find_keywords(text)
+
+    def categorize(self, name: str, text: str) -> Optional[str]:
+        """Category of a text, falling back to the taxonomy's default"""
+        taxonomy = self.get(name)
+        return taxonomy.matcher.categorize(text, taxonomy.default)
+
+    def keywords(self, name: str, category: Optional[str] = None) -> Set[str]:
+        """Keywords of a taxonomy, optionally limited to one category"""
+        return self.get(name).matcher.keywords(category)
+
+
+_shared_taxonomy: Optional[KeywordTaxonomy] = None
+_shared_taxonomy_lock = threading.Lock()
+
+def get_taxonomy() -> KeywordTaxonomy:
+    """Get the process-wide keyword taxonomy"""
+    global _shared_taxonomy
+    with _shared_taxonomy_lock:
+        if _shared_taxonomy is None:
+            _shared_taxonomy = KeywordTaxonomy()
+        return _shared_taxonomy
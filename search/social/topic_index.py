@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Incrementally maintained token -> topics index for related-topic lookups
+"""
+
+import math
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+def tokenize_topic(topic: str) -> FrozenSet[str]:
+    """Lowercase word tokens of a topic, with hashtag and mention markers stripped"""
+    tokens = (word.lstrip('#@') for word in topic.lower().split())
+    return frozenset(token for token in tokens if token)
+
+class RelatedTopicIndex:
+    """Inverted index from topic tokens to the topics in history that contain them
+
+    Topics are reference counted, so adding a topic once per history entry and
+    removing it once per evicted entry keeps the index in step with the history.
+    """
+
+    def __init__(self):
+        self._topic_counts: Counter = Counter()
+        self._topic_tokens: Dict[str, FrozenSet[str]] = {}
+        self._token_topics: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._topic_tokens)
+
+    def __contains__(self, topic: str) -> bool:
+        return topic in self._topic_tokens
+
+    def add(self, topic: str) -> None:
+        """Record one history entry for a topic"""
+        self._topic_counts[topic] += 1
+        if topic in self._topic_tokens:
+            return
+
+        tokens = tokenize_topic(topic)
+        self._topic_tokens[topic] = tokens
+        for token in tokens:
+            self._token_topics[token].add(topic)
+
+    def add_many(self, topics: Iterable[str]) -> None:
+        for topic in topics:
+            self.add(topic)
+
+    def remove(self, topic: str) -> None:
+        """Forget one history entry for a topic, dropping it once no entries remain"""
+        if self._topic_counts[topic] > 1:
+            self._topic_counts[topic] -= 1
+            return
+
+        self._topic_counts.pop(topic, None)
+        for token in self._topic_tokens.pop(topic, ()):
+            topics = self._token_topics.get(token)
+            if topics is not None:
+                topics.discard(topic)
+                if not topics:
+                    del self._token_topics[token]
+
+    def remove_many(self, topics: Iterable[str]) -> None:
+        for topic in topics:
+            self.remove(topic)
+
+    def clear(self) -> None:
+        self._topic_counts.clear()
+        self._topic_tokens.clear()
+        self._token_topics.clear()
+
+    def related(self, topic: str, limit: int = 5) -> List[str]:
+        """Topics sharing tokens with the given topic, strongest overlap first
+
+        A shared token weighs more the fewer topics contain it, so 'rust async'
+        relates to 'async rust runtime' ahead of every other topic mentioning 'ai'.
+        Ties go to the topic seen most often in history.
+        """
+        total_topics = len(self._topic_tokens) or 1
+        weights: Dict[str, float] = defaultdict(float)
+
+        for token in tokenize_topic(topic):
+            postings = self._token_topics.get(token)
+            if not postings:
+                continue
+            token_weight = math.log(1 + total_topics / len(postings))
+            for other in postings:
+                if other != topic:
+                    weights[other] += token_weight
+
+        ranked = sorted(weights, key=lambda other: (-weights[other], -self._topic_counts[other], other))
+        return ranked[:limit]
@@ -8,16 +8,22 @@ import os
 import requests
 import json
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Iterable
 from datetime import datetime, timedelta
 import time
+import threading
+from ..config import Config
+from .taxonomy import get_taxonomy
 
 logger = logging.getLogger(__name__)
 
+# The v2 lookup endpoints accept up to 100 usernames or IDs per request
+LOOKUP_BATCH_SIZE = 100
+
 class TwitterAPIv2:
     """Twitter API v2 client for trending topics and search"""
     
-    def __init__(self):
+    def __init__(self, user_id_cache: Optional['UserIdCache'] = None):
         self.bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
         self.api_key = os.getenv('TWITTER_API_KEY')
         self.api_secret = os.getenv('TWITTER_API_SECRET')
@@ -32,6 +38,11 @@ class TwitterAPIv2:
             "Authorization": f"Bearer {self.bearer_token}",
             "Content-Type": "application/json"
         } if self.bearer_token else {}
+        
+        # Reuse connections across calls and never hang on a slow endpoint
+        self.session = requests.Session()
+        self.timeout = 15
+        self.user_id_cache = user_id_cache or get_shared_user_id_cache()
 
     def bearer_oauth(self, r):
         """Method required by bearer token authentication"""
@@ -51,7 +62,7 @@ class TwitterAPIv2:
             return None
             
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -64,7 +75,7 @@ class TwitterAPIv2:
         url = f"https://api.twitter.com/1.1/trends/place.json?id={woeid}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
             if response.status_code == 200:
                 trends_data = response.json()
                 if trends_data and len(trends_data) > 0:
@@ -99,7 +110,7 @@ class TwitterAPIv2:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
             if response.status_code == 200:
                 data = response.json()
                 tweets = data.get('data', [])
@@ -128,38 +139,37 @@ class TwitterAPIv2:
 
     def get_tweet_by_id(self, tweet_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific tweet by ID using Twitter API v2"""
+        tweets = self.get_tweets_by_ids([tweet_id])
+        return tweets[0] if tweets else None
+
+    def get_tweets_by_ids(self, tweet_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Get tweets by ID, up to 100 per request, in the order requested"""
         if not self.bearer_token:
             logger.error("No bearer token available for Twitter API")
-            return None
-        
-        url = f"{self.base_url}/tweets/{tweet_id}"
-        params = {
-            'tweet.fields': 'created_at,public_metrics,context_annotations,lang',
-            'expansions': 'author_id'
-        }
-        
-        try:
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                tweet = data.get('data', {})
-                users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
-                
-                if tweet:
-                    author = users.get(tweet.get('author_id', ''), {})
-                    return {
-                        'id': tweet['id'],
-                        'text': tweet['text'],
-                        'created_at': tweet.get('created_at'),
-                        'author_name': author.get('name', 'Unknown'),
-                        'author_username': author.get('username', 'unknown'),
-                        'public_metrics': tweet.get('public_metrics', {}),
-                        'lang': tweet.get('lang', 'en')
-                    }
-        except Exception as e:
-            logger.error(f"Error getting tweet {tweet_id}: {e}")
-        
-        return None
+            return []
+
+        ids = list(dict.fromkeys(str(tweet_id) for tweet_id in tweet_ids))
+        url = f"{self.base_url}/tweets"
+        found: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(ids), LOOKUP_BATCH_SIZE):
+            batch = ids[start:start + LOOKUP_BATCH_SIZE]
+            params = {
+                'ids': ','.join(batch),
+                'tweet.fields': 'created_at,public_metrics,context_annotations,lang',
+                'expansions': 'author_id'
+            }
+            data = self.connect_to_endpoint(url, self.headers, params)
+            if not data:
+                continue
+
+            users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
+            for tweet in data.get('data', []):
+                found[tweet['id']] = format_tweet(tweet, users)
+            for error in data.get('errors', []):
+                logger.debug(f"Tweet lookup error: {error.get('detail', error)}")
+
+        return [found[tweet_id] for tweet_id in ids if tweet_id in found]
 
     def get_user_tweets(self, username: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Get tweets from a specific user"""
@@ -179,7 +189,7 @@ class TwitterAPIv2:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
             if response.status_code == 200:
                 data = response.json()
                 tweets = data.get('data', [])
@@ -204,118 +214,218 @@ class TwitterAPIv2:
 
     def get_user_id(self, username: str) -> Optional[str]:
         """Get user ID from username"""
+        return self.get_user_ids([username]).get(normalize_username(username))
+
+    def get_user_ids(self, usernames: Iterable[str]) -> Dict[str, str]:
+        """Resolve usernames to user IDs, serving cached IDs and batching the rest"""
+        names = list(dict.fromkeys(normalize_username(name) for name in usernames if name))
+        resolved = self.user_id_cache.get_many(names)
+        missing = [name for name in names if name not in resolved]
+
+        if missing and self.bearer_token:
+            url = f"{self.base_url}/users/by"
+            fetched: Dict[str, str] = {}
+            for start in range(0, len(missing), LOOKUP_BATCH_SIZE):
+                batch = missing[start:start + LOOKUP_BATCH_SIZE]
+                data = self.connect_to_endpoint(url, self.headers, {'usernames': ','.join(batch)})
+                if not data:
+                    continue
+
+                for user in data.get('data', []):
+                    fetched[normalize_username(user['username'])] = user['id']
+                for error in data.get('errors', []):
+                    logger.warning(f"Twitter API user lookup failed: {error.get('detail', error)}")
+
+            if fetched:
+                self.user_id_cache.update(fetched)
+                resolved.update(fetched)
+
+        return resolved
+
+    def iter_recent_tweets(self, query: str, max_tweets: int = 500, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield recent tweets page by page, following next_token up to max_tweets"""
         if not self.bearer_token:
-            return None
-        
-        url = f"{self.base_url}/users/by/username/{username}"
-        
-        try:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                data = response.json()
-                user = data.get('data', {})
-                return user.get('id')
-            else:
-                logger.error(f"Twitter API user lookup failed: {response.status_code} - {response.text}")
-        except Exception as e:
-            logger.error(f"Error getting user ID: {e}")
-        
-        return None
+            logger.error("No bearer token available for Twitter API search")
+            return
+
+        url = f"{self.base_url}/tweets/search/recent"
+        params = {
+            'query': query,
+            'max_results': max(10, min(page_size, 100)),  # API accepts 10-100 per page
+            'tweet.fields': 'created_at,public_metrics,context_annotations,lang',
+            'expansions': 'author_id'
+        }
+
+        yielded = 0
+        while yielded < max_tweets:
+            data = self.connect_to_endpoint(url, self.headers, params)
+            if not data:
+                return
 
-    def analyze_trending_topics(self, query: str = "AI coding OR programming OR software development") -> List[Dict[str, Any]]:
+            users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
+            for tweet in data.get('data', []):
+                yield format_tweet(tweet, users)
+                yielded += 1
+                if yielded >= max_tweets:
+                    return
+
+            next_token = data.get('meta', {}).get('next_token')
+            if not next_token:
+                return
+            params['next_token'] = next_token
+
+    def analyze_trending_topics(self, query: str = "AI coding OR programming OR software development",
+                                max_tweets: int = 500) -> List[Dict[str, Any]]:
         """Analyze trending topics related to coding and AI"""
         try:
-            # Get recent tweets about the topic
-            tweets = self.search_recent_tweets(query, max_results=50)
-            
-            if not tweets:
+            # Consume tweets page by page without holding them all in memory
+            accumulator = TrendingTopicAccumulator()
+            for tweet in self.iter_recent_tweets(query, max_tweets=max_tweets):
+                accumulator.add(tweet)
+
+            if not accumulator.tweets_seen:
                 return []
-            
-            # Analyze engagement metrics
-            trending_topics = []
-            topic_counts = {}
-            
-            for tweet in tweets:
-                metrics = tweet.get('public_metrics', {})
-                engagement_score = (
-                    metrics.get('like_count', 0) +
-                    metrics.get('retweet_count', 0) * 2 +
-                    metrics.get('reply_count', 0) * 1.5 +
-                    metrics.get('quote_count', 0) * 2.5
-                )
-                
-                # Extract keywords from tweet text
-                text = tweet['text'].lower()
-                keywords = self._extract_keywords(text)
-                
-                for keyword in keywords:
-                    if keyword not in topic_counts:
-                        topic_counts[keyword] = {
-                            'count': 0,
-                            'total_engagement': 0,
-                            'tweets': []
-                        }
-                    
-                    topic_counts[keyword]['count'] += 1
-                    topic_counts[keyword]['total_engagement'] += engagement_score
-                    topic_counts[keyword]['tweets'].append(tweet)
-            
-            # Sort by engagement and frequency
-            for keyword, data in topic_counts.items():
-                if data['count'] >= 2:  # Only include topics mentioned multiple times
-                    trending_topics.append({
-                        'topic': keyword,
-                        'frequency': data['count'],
-                        'engagement_score': data['total_engagement'],
-                        'avg_engagement': data['total_engagement'] / data['count'],
-                        'tweets_count': len(data['tweets']),
-                        'category': self._categorize_topic(keyword)
-                    })
-            
-            # Sort by combined score (frequency * engagement)
-            trending_topics.sort(key=lambda x: x['frequency'] * x['avg_engagement'], reverse=True)
-            
-            return trending_topics[:20]  # Return top 20 trending topics
-            
+
+            return accumulator.results(20)  # Return top 20 trending topics
+
         except Exception as e:
             logger.error(f"Error analyzing trending topics: {e}")
             return []
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract relevant keywords from tweet text"""
-        # Define relevant keywords for AI and coding
-        keywords = [
-            'ai coding', 'artificial intelligence', 'machine learning', 'deep learning',
-            'python', 'javascript', 'java', 'typescript', 'react', 'vue', 'angular',
-            'github', 'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-            'chatgpt', 'claude', 'copilot', 'bard', 'openai', 'anthropic',
-            'coding', 'programming', 'software development', 'web development',
-            'data science', 'data analysis', 'big data', 'analytics',
-            'devops', 'cicd', 'automation', 'testing', 'agile', 'scrum'
-        ]
-        
-        found_keywords = []
-        text_lower = text.lower()
-        
-        for keyword in keywords:
-            if keyword in text_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords
+        return extract_keywords(text)
 
     def _categorize_topic(self, topic: str) -> str:
         """Categorize a topic based on its content"""
-        topic_lower = topic.lower()
-        
-        if any(word in topic_lower for word in ['ai', 'artificial', 'machine', 'deep', 'chatgpt', 'claude', 'copilot']):
-            return 'AI/ML'
-        elif any(word in topic_lower for word in ['python', 'javascript', 'java', 'typescript', 'react', 'vue', 'angular']):
-            return 'Programming Languages'
-        elif any(word in topic_lower for word in ['github', 'git', 'docker', 'kubernetes', 'devops', 'cicd']):
-            return 'Development Tools'
-        elif any(word in topic_lower for word in ['data', 'analytics', 'science', 'big data']):
-            return 'Data Science'
-        elif any(word in topic_lower for word in ['coding', 'programming', 'development', 'software']):
-            return 'Software Development'
-        else:
-            return 'Technology'
+        return categorize_topic(topic)
+
+def extract_keywords(text: str) -> List[str]:
+    """Extract relevant keywords from tweet text"""
+    return get_taxonomy().find_keywords('tweet_keywords', text)
+
+def categorize_topic(topic: str) -> str:
+    """Categorize a topic based on its content"""
+    return get_taxonomy().categorize('tweet_categories', topic)
+
+def format_tweet(tweet: Dict[str, Any], users: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Convert an API tweet object into the client's result format"""
+    result = {
+        'id': tweet['id'],
+        'text': tweet['text'],
+        'created_at': tweet.get('created_at'),
+        'public_metrics': tweet.get('public_metrics', {}),
+        'lang': tweet.get('lang', 'en')
+    }
+    if users is not None:
+        author = users.get(tweet.get('author_id', ''), {})
+        result['author_name'] = author.get('name', 'Unknown')
+        result['author_username'] = author.get('username', 'unknown')
+    return result
+
+def normalize_username(username: str) -> str:
+    """Normalize a handle such as '@GitHub' to the cache key 'github'"""
+    return username.strip().lstrip('@').lower()
+
+class UserIdCache:
+    """Username to user ID cache kept in memory and mirrored to a JSON file"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path if path is not None else Config.TWITTER_USER_ID_CACHE_PATH
+        self._ids: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get_many(self, usernames: Iterable[str]) -> Dict[str, str]:
+        """Get the cached IDs of the given normalized usernames"""
+        with self._lock:
+            return {name: self._ids[name] for name in usernames if name in self._ids}
+
+    def update(self, ids: Dict[str, str]) -> None:
+        """Add resolved IDs and persist the cache"""
+        with self._lock:
+            self._ids.update(ids)
+            self._save()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self._ids = {normalize_username(name): str(user_id) for name, user_id in json.load(f).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not load Twitter user ID cache from {self.path}: {e}")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._ids, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save Twitter user ID cache to {self.path}: {e}")
+
+_shared_user_id_cache: Optional[UserIdCache] = None
+_shared_user_id_cache_lock = threading.Lock()
+
+def get_shared_user_id_cache() -> UserIdCache:
+    """Get the process-wide username to user ID cache"""
+    global _shared_user_id_cache
+    with _shared_user_id_cache_lock:
+        if _shared_user_id_cache is None:
+            _shared_user_id_cache = UserIdCache()
+        return _shared_user_id_cache
+
+class TrendingTopicAccumulator:
+    """Aggregates keyword frequency and engagement over a tweet stream in bounded memory"""
+
+    def __init__(self, min_count: int = 2):
+        self.min_count = min_count
+        self.tweets_seen = 0
+        self.topic_counts: Dict[str, Dict[str, float]] = {}
+
+    def add(self, tweet: Dict[str, Any]) -> None:
+        """Fold one tweet into the running keyword totals"""
+        self.tweets_seen += 1
+        metrics = tweet.get('public_metrics', {})
+        engagement_score = (
+            metrics.get('like_count', 0) +
+            metrics.get('retweet_count', 0) * 2 +
+            metrics.get('reply_count', 0) * 1.5 +
+            metrics.get('quote_count', 0) * 2.5
+        )
+
+        # Extract keywords from tweet text
+        for keyword in extract_keywords(tweet['text'].lower()):
+            if keyword not in self.topic_counts:
+                self.topic_counts[keyword] = {
+                    'count': 0,
+                    'total_engagement': 0
+                }
+
+            self.topic_counts[keyword]['count'] += 1
+            self.topic_counts[keyword]['total_engagement'] += engagement_score
+
+    def results(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get the top topics ranked by frequency * average engagement"""
+        trending_topics = []
+        for keyword, data in self.topic_counts.items():
+            if data['count'] >= self.min_count:  # Only include topics mentioned multiple times
+                trending_topics.append({
+                    'topic': keyword,
+                    'frequency': data['count'],
+                    'engagement_score': data['total_engagement'],
+                    'avg_engagement': data['total_engagement'] / data['count'],
+                    'tweets_count': data['count'],
+                    'category': categorize_topic(keyword)
+                })
+
+        # Sort by combined score (frequency * engagement)
+        trending_topics.sort(key=lambda x: x['frequency'] * x['avg_engagement'], reverse=True)
+
+        return trending_topics[:limit]
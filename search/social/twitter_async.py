@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Async Twitter API v2 client with pooled connections and rate-limit aware scheduling
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, AsyncIterator, Iterable
+from ..config import Config
+from ..engines.http import HTTPTransport
+from .twitter_api_v2 import (
+    LOOKUP_BATCH_SIZE, TrendingTopicAccumulator, UserIdCache, format_tweet,
+    get_shared_user_id_cache, normalize_username
+)
+
+logger = logging.getLogger(__name__)
+
+TWEET_FIELDS = 'created_at,public_metrics,context_annotations,lang'
+
+@dataclass
+class RateLimitBudget:
+    """Rate-limit budget of one API endpoint, as reported by response headers"""
+    endpoint: str
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: float = 0.0  # epoch seconds
+    probe_in_flight: bool = False  # a request was sent while the budget was unknown
+
+class RateLimitTracker:
+    """Tracks per-endpoint budgets and queues requests until a window resets"""
+
+    def __init__(self):
+        self._budgets: Dict[str, RateLimitBudget] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._probes: Dict[str, asyncio.Event] = {}
+
+    def _budget(self, endpoint: str) -> RateLimitBudget:
+        if endpoint not in self._budgets:
+            self._budgets[endpoint] = RateLimitBudget(endpoint=endpoint)
+        return self._budgets[endpoint]
+
+    async def acquire(self, endpoint: str, max_wait: float) -> bool:
+        """Reserve one request, waiting for the window reset if the budget is spent"""
+        lock = self._locks.setdefault(endpoint, asyncio.Lock())
+
+        # Requests for the same endpoint queue on the lock in arrival order
+        async with lock:
+            budget = self._budget(endpoint)
+            if budget.probe_in_flight:
+                try:
+                    await asyncio.wait_for(self._probes[endpoint].wait(), max_wait)
+                except asyncio.TimeoutError:
+                    return False
+
+            if budget.remaining is not None and budget.remaining <= 0:
+                wait = budget.reset_at - time.time()
+                if wait > max_wait:
+                    return False
+                if wait > 0:
+                    logger.info(f"Rate limit for {endpoint} exhausted, waiting {wait:.0f}s for reset")
+                    await asyncio.sleep(wait)
+                if budget.limit is not None:
+                    # The new window starts full; the next response corrects the count
+                    budget.remaining = budget.limit - 1
+                    return True
+                budget.remaining = None
+            elif budget.remaining is not None:
+                budget.remaining -= 1
+                return True
+
+            # Budget unknown: send this request alone and hold the rest until it reports one
+            budget.probe_in_flight = True
+            self._probes[endpoint] = asyncio.Event()
+            return True
+
+    def update(self, endpoint: str, headers) -> None:
+        """Record the budget reported by x-rate-limit-* response headers"""
+        budget = self._budget(endpoint)
+        try:
+            if 'x-rate-limit-limit' in headers:
+                budget.limit = int(headers['x-rate-limit-limit'])
+            if 'x-rate-limit-remaining' in headers:
+                budget.remaining = int(headers['x-rate-limit-remaining'])
+            if 'x-rate-limit-reset' in headers:
+                budget.reset_at = float(headers['x-rate-limit-reset'])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid rate-limit headers for {endpoint}: {e}")
+        self.release(endpoint)
+
+    def release(self, endpoint: str) -> None:
+        """Let queued requests through once the request sent with an unknown budget is done"""
+        budget = self._budget(endpoint)
+        if budget.probe_in_flight:
+            budget.probe_in_flight = False
+            self._probes[endpoint].set()
+
+    def exhaust(self, endpoint: str, headers) -> None:
+        """Mark an endpoint as spent after a 429 response"""
+        self.update(endpoint, headers)
+        budget = self._budget(endpoint)
+        budget.remaining = 0
+        if budget.reset_at <= time.time():
+            # No reset header: back off for a standard 15 minute window
+            budget.reset_at = time.time() + 15 * 60
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Get the current budget of every endpoint seen so far"""
+        now = time.time()
+        return {
+            endpoint: {
+                'limit': budget.limit,
+                'remaining': budget.remaining,
+                'reset_at': budget.reset_at,
+                'reset_in_seconds': max(0.0, budget.reset_at - now)
+            }
+            for endpoint, budget in self._budgets.items()
+        }
+
+class AsyncTwitterAPIv2:
+    """Async Twitter API v2 client sharing one connection pool and rate-limit budgets"""
+
+    def __init__(self, bearer_token: Optional[str] = None, transport: Optional[HTTPTransport] = None,
+                 max_rate_limit_wait: Optional[float] = None, max_retries: int = 1,
+                 user_id_cache: Optional[UserIdCache] = None):
+        self.bearer_token = bearer_token or os.getenv('TWITTER_BEARER_TOKEN')
+        if not self.bearer_token:
+            logger.warning("Twitter Bearer Token not found. Twitter API functionality will be limited.")
+
+        self.base_url = "https://api.twitter.com/2"
+        self.headers = {
+            "Authorization": f"Bearer {self.bearer_token}",
+            "Content-Type": "application/json"
+        } if self.bearer_token else {}
+
+        self.transport = transport or HTTPTransport()
+        self.rate_limits = RateLimitTracker()
+        self.max_rate_limit_wait = max_rate_limit_wait or Config.TWITTER_MAX_RATE_LIMIT_WAIT
+        self.max_retries = max_retries
+        self.user_id_cache = user_id_cache or get_shared_user_id_cache()
+
+    async def _get(self, endpoint: str, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """GET an API path, honouring the endpoint's rate-limit budget"""
+        if not self.bearer_token:
+            logger.error("No bearer token available for Twitter API")
+            return None
+
+        for attempt in range(self.max_retries + 1):
+            if not await self.rate_limits.acquire(endpoint, self.max_rate_limit_wait):
+                logger.error(f"Twitter API rate limit for {endpoint} exhausted beyond {self.max_rate_limit_wait}s")
+                return None
+
+            try:
+                session = self.transport.get_session()
+                async with session.get(f"{self.base_url}{path}", headers=self.headers, params=params) as response:
+                    if response.status == 429:
+                        self.rate_limits.exhaust(endpoint, response.headers)
+                        logger.warning(f"Twitter API rate limited on {endpoint} (attempt {attempt + 1})")
+                        continue
+
+                    self.rate_limits.update(endpoint, response.headers)
+                    if response.status == 200:
+                        return await response.json()
+
+                    logger.error(f"Twitter API request failed: {response.status} - {await response.text()}")
+                    return None
+            except Exception as e:
+                logger.error(f"Twitter API request failed: {e}")
+                return None
+            finally:
+                # Without headers (errors, cancellation) the next queued request probes instead
+                self.rate_limits.release(endpoint)
+
+        return None
+
+    async def search_recent_tweets(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """Search for recent tweets"""
+        params = {
+            'query': query,
+            'max_results': max(10, min(max_results, 100)),  # API accepts 10-100
+            'tweet.fields': TWEET_FIELDS,
+            'expansions': 'author_id'
+        }
+
+        data = await self._get('/tweets/search/recent', '/tweets/search/recent', params)
+        if not data:
+            return []
+
+        users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
+        return [format_tweet(tweet, users) for tweet in data.get('data', [])][:max_results]
+
+    async def iter_recent_tweets(self, query: str, max_tweets: int = 500,
+                                 page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """Yield recent tweets as pages arrive, following next_token up to max_tweets"""
+        params = {
+            'query': query,
+            'max_results': max(10, min(page_size, 100)),  # API accepts 10-100 per page
+            'tweet.fields': TWEET_FIELDS,
+            'expansions': 'author_id'
+        }
+
+        yielded = 0
+        while yielded < max_tweets:
+            data = await self._get('/tweets/search/recent', '/tweets/search/recent', params)
+            if not data:
+                return
+
+            users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
+            for tweet in data.get('data', []):
+                yield format_tweet(tweet, users)
+                yielded += 1
+                if yielded >= max_tweets:
+                    return
+
+            next_token = data.get('meta', {}).get('next_token')
+            if not next_token:
+                return
+            params['next_token'] = next_token
+
+    async def analyze_trending_topics(self, query: str = "AI coding OR programming OR software development",
+                                      max_tweets: int = 500) -> List[Dict[str, Any]]:
+        """Analyze trending topics from a paginated tweet stream"""
+        try:
+            accumulator = TrendingTopicAccumulator()
+            async for tweet in self.iter_recent_tweets(query, max_tweets=max_tweets):
+                accumulator.add(tweet)
+            return accumulator.results(20)
+        except Exception as e:
+            logger.error(f"Error analyzing trending topics: {e}")
+            return []
+
+    async def get_tweet_by_id(self, tweet_id: str) -> Optional[Dict[str, Any]]:
+        """Get a specific tweet by ID"""
+        tweets = await self.get_tweets_by_ids([tweet_id])
+        return tweets[0] if tweets else None
+
+    async def get_tweets_by_ids(self, tweet_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Get tweets by ID, up to 100 per request, in the order requested"""
+        ids = list(dict.fromkeys(str(tweet_id) for tweet_id in tweet_ids))
+        found: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(ids), LOOKUP_BATCH_SIZE):
+            params = {
+                'ids': ','.join(ids[start:start + LOOKUP_BATCH_SIZE]),
+                'tweet.fields': TWEET_FIELDS,
+                'expansions': 'author_id'
+            }
+            data = await self._get('/tweets', '/tweets', params)
+            if not data:
+                continue
+
+            users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
+            for tweet in data.get('data', []):
+                found[tweet['id']] = format_tweet(tweet, users)
+
+        return [found[tweet_id] for tweet_id in ids if tweet_id in found]
+
+    async def get_user_id(self, username: str) -> Optional[str]:
+        """Get user ID from username"""
+        return (await self.get_user_ids([username])).get(normalize_username(username))
+
+    async def get_user_ids(self, usernames: Iterable[str]) -> Dict[str, str]:
+        """Resolve usernames to user IDs, serving cached IDs and batching the rest"""
+        names = list(dict.fromkeys(normalize_username(name) for name in usernames if name))
+        resolved = self.user_id_cache.get_many(names)
+        missing = [name for name in names if name not in resolved]
+
+        fetched: Dict[str, str] = {}
+        for start in range(0, len(missing), LOOKUP_BATCH_SIZE):
+            params = {'usernames': ','.join(missing[start:start + LOOKUP_BATCH_SIZE])}
+            data = await self._get('/users/by', '/users/by', params)
+            if not data:
+                continue
+
+            for user in data.get('data', []):
+                fetched[normalize_username(user['username'])] = user['id']
+            for error in data.get('errors', []):
+                logger.warning(f"Twitter API user lookup failed: {error.get('detail', error)}")
+
+        if fetched:
+            self.user_id_cache.update(fetched)
+            resolved.update(fetched)
+        return resolved
+
+    async def get_user_tweets(self, username: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """Get tweets from a specific user"""
+        user_id = await self.get_user_id(username)
+        if not user_id:
+            return []
+
+        params = {
+            'max_results': max(5, min(max_results, 100)),  # API accepts 5-100
+            'tweet.fields': TWEET_FIELDS
+        }
+
+        data = await self._get('/users/:id/tweets', f"/users/{user_id}/tweets", params)
+        if not data:
+            return []
+
+        return [format_tweet(tweet) for tweet in data.get('data', [])][:max_results]
+
+    def get_rate_limit_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-endpoint rate-limit budgets for monitoring"""
+        return self.rate_limits.status()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session"""
+        await self.transport.close()
@@ -4,11 +4,15 @@ X.com trending topics analyzer for coding and software development
 """
 
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from collections import Counter
 from dataclasses import dataclass
 from .x_trending import XTrendingDetector, XTrendingData, XTrendingTopic
+from .history import TrendingHistory, get_shared_history
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -26,26 +30,53 @@ class XTrendingAnalysis:
 class XTrendingAnalyzer:
     """X.com trending topics analyzer"""
     
-    def __init__(self):
+    def __init__(self, cache_ttl: Optional[float] = None, history: Optional[TrendingHistory] = None):
         self.detector = XTrendingDetector()
-        self.historical_data = []  # Store historical trending data
         
-    def analyze_trending_topics(self, time_window: str = "24h") -> List[XTrendingAnalysis]:
-        """Analyze trending topics over a time window"""
-        logger.info(f"Analyzing X.com trending topics for {time_window}")
+        # Last 7 days of trending data, shared by every analyzer in the process
+        self.historical_data = history or get_shared_history()
         
-        # Get current trending data
+        # One scrape feeds every category analysis while the snapshot is fresh
+        self.cache_ttl = Config.X_TRENDING_CACHE_TTL if cache_ttl is None else cache_ttl
+        self._snapshot: Optional[List[XTrendingData]] = None
+        self._snapshot_at = 0.0
+        self._snapshot_lock = threading.Lock()
+    
+    def get_trending_data(self) -> List[XTrendingData]:
+        """Get trending data, reusing the current snapshot while it is fresh"""
+        with self._snapshot_lock:
+            if self._snapshot is not None and time.monotonic() - self._snapshot_at < self.cache_ttl:
+                return self._snapshot
+            return self._refresh_snapshot()
+    
+    def refresh_trending_data(self) -> List[XTrendingData]:
+        """Scrape X.com now and replace the current snapshot"""
+        with self._snapshot_lock:
+            return self._refresh_snapshot()
+    
+    def _refresh_snapshot(self) -> List[XTrendingData]:
+        """Scrape trending data and record it in history; caller holds the snapshot lock"""
         current_data = self.detector.get_trending_data()
+        self._snapshot = current_data
+        self._snapshot_at = time.monotonic()
         
         # Store historical data
         self.historical_data.extend(current_data)
         
         # Keep only recent data (last 7 days)
-        cutoff = datetime.now() - timedelta(days=7)
-        self.historical_data = [
-            data for data in self.historical_data 
-            if data.timestamp >= cutoff
-        ]
+        self.historical_data.expire()
+        
+        if self.historical_data.path and self.historical_data.storage is None:
+            self.historical_data.save()
+        
+        return current_data
+        
+    def analyze_trending_topics(self, time_window: str = "24h") -> List[XTrendingAnalysis]:
+        """Analyze trending topics over a time window"""
+        logger.info(f"Analyzing X.com trending topics for {time_window}")
+        
+        # Get current trending data
+        current_data = self.get_trending_data()
         
         # Analyze trends
         analyses = []
@@ -67,7 +98,7 @@ class XTrendingAnalyzer:
         logger.info("Analyzing AI coding trends on X.com")
         
         # Get trending data
-        trending_data = self.detector.get_trending_data()
+        trending_data = self.get_trending_data()
         
         # Filter for AI coding topics
         ai_coding_data = [
@@ -95,7 +126,7 @@ class XTrendingAnalyzer:
         logger.info("Analyzing software development trends on X.com")
         
         # Get trending data
-        trending_data = self.detector.get_trending_data()
+        trending_data = self.get_trending_data()
         
         # Filter for software development topics
         dev_topics = [
@@ -127,7 +158,7 @@ class XTrendingAnalyzer:
         logger.info("Analyzing new programming language trends on X.com")
         
         # Get trending data
-        trending_data = self.detector.get_trending_data()
+        trending_data = self.get_trending_data()
         
         # Filter for programming language topics
         lang_data = [
@@ -155,7 +186,7 @@ class XTrendingAnalyzer:
         logger.info("Analyzing free AI coding bot trends on X.com")
         
         # Get trending data
-        trending_data = self.detector.get_trending_data()
+        trending_data = self.get_trending_data()
         
         # Filter for free AI coding topics
         free_ai_data = [
@@ -184,7 +215,7 @@ class XTrendingAnalyzer:
         logger.info(f"Getting top {limit} trending topics by engagement")
         
         # Get trending data
-        trending_data = self.detector.get_trending_data()
+        trending_data = self.get_trending_data()
         
         # Group by topic
         topic_groups = self._group_topics_by_name(trending_data)
@@ -288,23 +319,7 @@ class XTrendingAnalyzer:
     
     def _find_related_topics(self, topic_name: str, topic_data_list: List[XTrendingData]) -> List[str]:
         """Find related topics"""
-        # Simple implementation - in a real system, you'd use more sophisticated methods
-        related = []
-        
-        # Get all topics from historical data
-        all_topics = set()
-        for data in self.historical_data:
-            if data.topic != topic_name:
-                all_topics.add(data.topic)
-        
-        # Find topics that appear together
-        topic_words = set(topic_name.lower().split())
-        for other_topic in all_topics:
-            other_words = set(other_topic.lower().split())
-            if topic_words.intersection(other_words):
-                related.append(other_topic)
-        
-        return related[:5]  # Top 5 related topics
+        return self.historical_data.related_topics(topic_name, limit=5)  # Top 5 related topics
     
     def _calculate_final_score(self, frequency: int, engagement: float, trend: str) -> float:
         """Calculate final trending score"""
@@ -322,6 +337,9 @@ class XTrendingAnalyzer:
         """Get comprehensive analysis of all trending categories"""
         logger.info("Getting comprehensive X.com trending analysis")
         
+        # Scrape at most once; every category analysis below reuses the snapshot
+        self.get_trending_data()
+        
         return {
             "ai_coding": self.analyze_ai_coding_trends(),
             "software_development": self.analyze_software_development_trends(),
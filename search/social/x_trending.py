@@ -7,7 +7,7 @@ import logging
 import re
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from dataclasses import dataclass
 import requests
 from bs4 import BeautifulSoup
@@ -15,8 +15,10 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from .driver_pool import WebDriverPool, get_shared_driver_pool
+from .taxonomy import get_taxonomy
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -45,32 +47,10 @@ class XTrendingData:
 class XTrendingDetector:
     """X.com trending topics detector for coding and software development"""
     
-    def __init__(self):
+    def __init__(self, driver_pool: Optional[WebDriverPool] = None):
+        self.driver_pool = driver_pool or get_shared_driver_pool()
         self.base_url = "https://x.com"
         self.trending_url = "https://x.com/explore/tabs/trending"
-        self.coding_keywords = {
-            'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'typescript',
-            'react', 'vue', 'angular', 'django', 'flask', 'fastapi', 'nodejs', 'express', 'spring',
-            'laravel', 'rails', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'git', 'github',
-            'linux', 'windows', 'macos', 'api', 'rest', 'graphql', 'microservices', 'devops',
-            'ci/cd', 'testing', 'tdd', 'agile', 'scrum', 'machine learning', 'ai', 'data science',
-            'blockchain', 'cryptocurrency', 'web3', 'iot', 'cybersecurity', 'cloud', 'serverless'
-        }
-        
-        self.ai_coding_keywords = {
-            'github copilot', 'chatgpt', 'claude', 'bard', 'copilot x',
-            'tabnine', 'kite', 'codeium', 'amazon codewhisperer',
-            'cursor ai', 'replit ghostwriter', 'openai codex',
-            'free ai coding assistant', 'ai pair programming',
-            'ai code generation', 'ai programming tools',
-            'copilot alternative', 'ai coding free', 'github copilot free',
-            'chatgpt coding', 'claude coding', 'ai code completion',
-            'ai code review', 'ai debugging', 'ai refactoring',
-            'ai test generation', 'ai documentation', 'ai code explainer',
-            'ai programming assistant', 'ai development tools',
-            'free coding ai', 'open source ai coding', 'ai coding tutor'
-        }
-        
         self.tech_users_to_monitor = [
             '@github', '@microsoft', '@google', '@openai', '@anthropicai',
             '@nvidia', '@awscloud', '@azure', '@docker', '@kubernetesio',
@@ -80,69 +60,65 @@ class XTrendingDetector:
             '@wired', '@theverge', '@ars_technica'
         ]
 
-    def _setup_driver(self) -> webdriver.Chrome:
-        """Setup Chrome driver with options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-        except Exception as e:
-            logger.error(f"Failed to setup Chrome driver: {e}")
-            raise
+        self.taxonomy = get_taxonomy()
+
+    @property
+    def coding_keywords(self) -> Set[str]:
+        """Every keyword of the coding topic taxonomy"""
+        return self.taxonomy.keywords('x_topics')
+
+    @property
+    def ai_coding_keywords(self) -> Set[str]:
+        """Keywords of the AI coding category"""
+        return self.taxonomy.keywords('x_topics', 'ai_coding')
+
+    def warm_up(self) -> None:
+        """Start a browser ahead of the first scrape when X_DRIVER_POOL_WARM is enabled"""
+        if Config.X_DRIVER_POOL_WARM:
+            self.driver_pool.warm_in_background()
 
     def get_trending_topics(self) -> List[XTrendingTopic]:
         """Get trending topics from X.com"""
         trending_topics = []
         
         try:
-            driver = self._setup_driver()
-            
-            # Navigate to trending page
-            driver.get(self.trending_url)
-            
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='trend']"))
-            )
-            
-            # Find trending topics
-            trending_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='trend']")
-            
-            for i, element in enumerate(trending_elements[:20]):  # Top 20 trending
-                try:
-                    topic_text = element.text
-                    if topic_text:
-                        topic = self._extract_topic_from_text(topic_text)
-                        if topic and self._is_coding_related(topic):
-                            trending_topic = XTrendingTopic(
-                                topic=topic,
-                                tweet_count=self._extract_tweet_count(topic_text),
-                                engagement_score=self._calculate_engagement_score(topic_text),
-                                category=self._categorize_topic(topic),
-                                timestamp=datetime.now(),
-                                url=f"{self.base_url}/search?q={topic.replace(' ', '%20')}",
-                                hashtag=topic.startswith('#'),
-                                trending_rank=i + 1
-                            )
-                            trending_topics.append(trending_topic)
-                            
-                except Exception as e:
-                    logger.warning(f"Error processing trending element: {e}")
-                    continue
-            
-            driver.quit()
-            
+            with self.driver_pool.checkout() as driver:
+                # Navigate to trending page
+                driver.get(self.trending_url)
+
+                # Wait for page to load
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='trend']"))
+                )
+
+                # Find trending topics
+                trending_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='trend']")
+
+                for i, element in enumerate(trending_elements[:20]):  # Top 20 trending
+                    try:
+                        topic_text = element.text
+                        if topic_text:
+                            topic = self._extract_topic_from_text(topic_text)
+                            category = self._classify_topic(topic) if topic else None
+                            if category:
+                                trending_topic = XTrendingTopic(
+                                    topic=topic,
+                                    tweet_count=self._extract_tweet_count(topic_text),
+                                    engagement_score=self._calculate_engagement_score(topic_text),
+                                    category=category,
+                                    timestamp=datetime.now(),
+                                    url=f"{self.base_url}/search?q={topic.replace(' ', '%20')}",
+                                    hashtag=topic.startswith('#'),
+                                    trending_rank=i + 1
+                                )
+                                trending_topics.append(trending_topic)
+
+                    except Exception as e:
+                        logger.warning(f"Error processing trending element: {e}")
+                        continue
+
         except Exception as e:
             logger.error(f"Error getting trending topics: {e}")
-            if 'driver' in locals():
-                driver.quit()
         
         return trending_topics
 
@@ -151,52 +127,48 @@ class XTrendingDetector:
         trending_topics = []
         
         try:
-            driver = self._setup_driver()
-            
-            # Navigate to user profile
-            profile_url = f"{self.base_url}/{username}"
-            driver.get(profile_url)
-            
-            # Wait for timeline to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='tweet']"))
-            )
-            
-            # Get tweets from timeline
-            tweet_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='tweet']")
-            
-            for element in tweet_elements[:10]:  # Analyze last 10 tweets
-                try:
-                    tweet_text = element.text
-                    if tweet_text:
-                        # Extract hashtags and mentions
-                        hashtags = re.findall(r'#\w+', tweet_text)
-                        mentions = re.findall(r'@\w+', tweet_text)
-                        
-                        for hashtag in hashtags:
-                            if self._is_coding_related(hashtag):
-                                trending_topic = XTrendingTopic(
-                                    topic=hashtag,
-                                    tweet_count=1,
-                                    engagement_score=self._calculate_engagement_score(tweet_text),
-                                    category=self._categorize_topic(hashtag),
-                                    timestamp=datetime.now(),
-                                    url=f"{self.base_url}/search?q={hashtag}",
-                                    hashtag=True,
-                                    trending_rank=0
-                                )
-                                trending_topics.append(trending_topic)
-                                
-                except Exception as e:
-                    logger.warning(f"Error processing tweet: {e}")
-                    continue
-            
-            driver.quit()
-            
+            with self.driver_pool.checkout() as driver:
+                # Navigate to user profile
+                profile_url = f"{self.base_url}/{username}"
+                driver.get(profile_url)
+
+                # Wait for timeline to load
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='tweet']"))
+                )
+
+                # Get tweets from timeline
+                tweet_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='tweet']")
+
+                for element in tweet_elements[:10]:  # Analyze last 10 tweets
+                    try:
+                        tweet_text = element.text
+                        if tweet_text:
+                            # Extract hashtags and mentions
+                            hashtags = re.findall(r'#\w+', tweet_text)
+                            mentions = re.findall(r'@\w+', tweet_text)
+
+                            for hashtag in hashtags:
+                                category = self._classify_topic(hashtag)
+                                if category:
+                                    trending_topic = XTrendingTopic(
+                                        topic=hashtag,
+                                        tweet_count=1,
+                                        engagement_score=self._calculate_engagement_score(tweet_text),
+                                        category=category,
+                                        timestamp=datetime.now(),
+                                        url=f"{self.base_url}/search?q={hashtag}",
+                                        hashtag=True,
+                                        trending_rank=0
+                                    )
+                                    trending_topics.append(trending_topic)
+
+                    except Exception as e:
+                        logger.warning(f"Error processing tweet: {e}")
+                        continue
+
         except Exception as e:
             logger.error(f"Error getting user timeline trends: {e}")
-            if 'driver' in locals():
-                driver.quit()
         
         return trending_topics
 
@@ -205,50 +177,46 @@ class XTrendingDetector:
         trending_topics = []
         
         try:
-            driver = self._setup_driver()
-            
-            # Search for the query
-            search_url = f"{self.base_url}/search?q={query.replace(' ', '%20')}&src=trend_click"
-            driver.get(search_url)
-            
-            # Wait for search results
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='tweet']"))
-            )
-            
-            # Get trending tweets
-            tweet_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='tweet']")
-            
-            for element in tweet_elements[:15]:  # Top 15 results
-                try:
-                    tweet_text = element.text
-                    if tweet_text:
-                        # Extract relevant keywords
-                        keywords = self._extract_keywords_from_tweet(tweet_text)
-                        for keyword in keywords:
-                            if self._is_coding_related(keyword):
-                                trending_topic = XTrendingTopic(
-                                    topic=keyword,
-                                    tweet_count=self._extract_tweet_count(tweet_text),
-                                    engagement_score=self._calculate_engagement_score(tweet_text),
-                                    category=self._categorize_topic(keyword),
-                                    timestamp=datetime.now(),
-                                    url=f"{self.base_url}/search?q={keyword.replace(' ', '%20')}",
-                                    hashtag=keyword.startswith('#'),
-                                    trending_rank=0
-                                )
-                                trending_topics.append(trending_topic)
-                                
-                except Exception as e:
-                    logger.warning(f"Error processing search result: {e}")
-                    continue
-            
-            driver.quit()
-            
+            with self.driver_pool.checkout() as driver:
+                # Search for the query
+                search_url = f"{self.base_url}/search?q={query.replace(' ', '%20')}&src=trend_click"
+                driver.get(search_url)
+
+                # Wait for search results
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='tweet']"))
+                )
+
+                # Get trending tweets
+                tweet_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='tweet']")
+
+                for element in tweet_elements[:15]:  # Top 15 results
+                    try:
+                        tweet_text = element.text
+                        if tweet_text:
+                            # Extract relevant keywords
+                            keywords = self._extract_keywords_from_tweet(tweet_text)
+                            for keyword in keywords:
+                                category = self._classify_topic(keyword)
+                                if category:
+                                    trending_topic = XTrendingTopic(
+                                        topic=keyword,
+                                        tweet_count=self._extract_tweet_count(tweet_text),
+                                        engagement_score=self._calculate_engagement_score(tweet_text),
+                                        category=category,
+                                        timestamp=datetime.now(),
+                                        url=f"{self.base_url}/search?q={keyword.replace(' ', '%20')}",
+                                        hashtag=keyword.startswith('#'),
+                                        trending_rank=0
+                                    )
+                                    trending_topics.append(trending_topic)
+
+                    except Exception as e:
+                        logger.warning(f"Error processing search result: {e}")
+                        continue
+
         except Exception as e:
             logger.error(f"Error searching coding trends: {e}")
-            if 'driver' in locals():
-                driver.quit()
         
         return trending_topics
 
@@ -312,50 +280,17 @@ class XTrendingDetector:
         
         return min(score, 1.0)
 
+    def _classify_topic(self, topic: str) -> Optional[str]:
+        """Get the topic's category, or None if it is not coding related"""
+        return self.taxonomy.match('x_topics', topic).category
+
     def _is_coding_related(self, topic: str) -> bool:
         """Check if topic is coding/software development related"""
-        topic_lower = topic.lower()
-        
-        # Check against coding keywords
-        for keyword in self.coding_keywords:
-            if keyword in topic_lower:
-                return True
-        
-        # Check against AI coding keywords
-        for keyword in self.ai_coding_keywords:
-            if keyword in topic_lower:
-                return True
-        
-        # Check for common coding patterns
-        coding_patterns = [
-            r'\b(code|coding|programming|development|software|tech|ai|ml)\b',
-            r'\b(python|java|javascript|typescript|go|rust|c\+\+|c#)\b',
-            r'\b(react|vue|angular|node|docker|kubernetes|aws|azure)\b',
-            r'\b(github|git|api|rest|graphql|microservices)\b'
-        ]
-        
-        for pattern in coding_patterns:
-            if re.search(pattern, topic_lower):
-                return True
-        
-        return False
+        return self._classify_topic(topic) is not None
 
     def _categorize_topic(self, topic: str) -> str:
         """Categorize topic into specific categories"""
-        topic_lower = topic.lower()
-        
-        if any(keyword in topic_lower for keyword in self.ai_coding_keywords):
-            return "ai_coding"
-        elif any(keyword in topic_lower for keyword in ['python', 'java', 'javascript', 'typescript', 'go', 'rust']):
-            return "programming_languages"
-        elif any(keyword in topic_lower for keyword in ['react', 'vue', 'angular', 'django', 'flask']):
-            return "frameworks"
-        elif any(keyword in topic_lower for keyword in ['docker', 'kubernetes', 'aws', 'azure', 'gcp']):
-            return "devops"
-        elif any(keyword in topic_lower for keyword in ['github', 'git', 'api', 'rest', 'graphql']):
-            return "tools"
-        else:
-            return "general_coding"
+        return self.taxonomy.categorize('x_topics', topic)
 
     def _extract_keywords_from_tweet(self, tweet_text: str) -> List[str]:
         """Extract relevant keywords from tweet text"""
@@ -369,11 +304,10 @@ class XTrendingDetector:
         mentions = re.findall(r'@\w+', tweet_text)
         keywords.extend(mentions)
         
-        # Extract potential keywords
-        words = re.findall(r'\b\w+\b', tweet_text.lower())
-        for word in words:
-            if len(word) > 3 and word in self.coding_keywords:
-                keywords.append(word)
+        # Extract taxonomy keywords
+        for keyword in self.taxonomy.find_keywords('x_topics', tweet_text):
+            if len(keyword) > 3:
+                keywords.append(keyword)
         
         return keywords
 
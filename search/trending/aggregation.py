@@ -5,29 +5,53 @@ Engagement aggregation service for time-series analysis
 
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import sqlite3
+from collections import defaultdict
+from datetime import date as date_type, datetime, timedelta
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import Select
 try:
-    from .models import EngagementMetrics, EngagementSummary, TopicSearchResult
-    from ..base import TrendingStorage
+    from .models import EngagementSummary, EngagementRollup, RollupWatermark, TopicSearchResult
+    from .storage import TrendingStorage, SUMMARY_KEY_COLUMNS, SUMMARY_VALUE_COLUMNS
+    from ..config import Config
 except ImportError:
-    try:
-        from .models import EngagementMetrics, EngagementSummary, TopicSearchResult
-        from .storage import TrendingStorage
-    except ImportError:
-        # For direct testing
-        import sys
-        import os
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-        from models import EngagementMetrics, EngagementSummary, TopicSearchResult
-        from storage import TrendingStorage
+    # For direct testing
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    from models import EngagementSummary, EngagementRollup, RollupWatermark, TopicSearchResult
+    from storage import TrendingStorage, SUMMARY_KEY_COLUMNS, SUMMARY_VALUE_COLUMNS
+    from config import Config
 
 logger = logging.getLogger(__name__)
 
+def period_start(period: str, date: datetime) -> datetime:
+    """Start of the daily, monthly or yearly period containing a date"""
+    start = date.replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    if period == 'monthly':
+        return start.replace(day=1)
+    if period == 'yearly':
+        return start.replace(month=1, day=1)
+    return start
+
+def _parse_day(value: Any) -> datetime:
+    """Normalize a SQL DATE() result (a date on Postgres, a string on SQLite) to midnight"""
+    if isinstance(value, datetime):
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if isinstance(value, date_type):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value)[:10])
+
 
 class EngagementAggregationService:
     """Service for aggregating engagement metrics across time periods"""
 
+    # TopicSearchResult aggregate columns are named '<period>_<metric type>'
+    METRIC_TYPES = ('likes', 'shares', 'comments')
+    PERIODS = ('daily', 'monthly', 'yearly')
+
     def __init__(self, storage: TrendingStorage):
         self.storage = storage
 
@@ -37,40 +61,9 @@ class EngagementAggregationService:
             start_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
             end_date = start_date + timedelta(days=1)
 
-            with self.storage.SessionLocal() as session:
-                # Get all engagement metrics for the day
-                metrics = session.query(EngagementMetrics)\
-                    .filter(EngagementMetrics.timestamp >= start_date)\
-                    .filter(EngagementMetrics.timestamp < end_date)\
-                    .all()
-
-                # Group by topic and metric type
-                topic_metrics = {}
-                for metric in metrics:
-                    key = (metric.topic_id, metric.metric_type)
-                    if key not in topic_metrics:
-                        topic_metrics[key] = 0
-                    topic_metrics[key] += metric.count
-
-                # Update topic search results with daily aggregates
-                updated_count = 0
-                for (topic_id, metric_type), count in topic_metrics.items():
-                    topic = session.query(TopicSearchResult)\
-                        .filter(TopicSearchResult.id == topic_id)\
-                        .first()
-
-                    if topic:
-                        if metric_type == 'likes':
-                            topic.daily_likes = count
-                        elif metric_type == 'shares':
-                            topic.daily_shares = count
-                        elif metric_type == 'comments':
-                            topic.daily_comments = count
-                        updated_count += 1
-
-                session.commit()
-                logger.info(f"Updated daily metrics for {updated_count} topics on {date.date()}")
-                return updated_count
+            updated_count = self._aggregate_period(start_date, end_date, 'daily')
+            logger.info(f"Updated daily metrics for {updated_count} topics on {date.date()}")
+            return updated_count
 
         except Exception as e:
             logger.error(f"Error aggregating daily metrics: {e}")
@@ -85,40 +78,9 @@ class EngagementAggregationService:
             else:
                 end_date = datetime(year, month + 1, 1)
 
-            with self.storage.SessionLocal() as session:
-                # Get all engagement metrics for the month
-                metrics = session.query(EngagementMetrics)\
-                    .filter(EngagementMetrics.timestamp >= start_date)\
-                    .filter(EngagementMetrics.timestamp < end_date)\
-                    .all()
-
-                # Group by topic and metric type
-                topic_metrics = {}
-                for metric in metrics:
-                    key = (metric.topic_id, metric.metric_type)
-                    if key not in topic_metrics:
-                        topic_metrics[key] = 0
-                    topic_metrics[key] += metric.count
-
-                # Update topic search results with monthly aggregates
-                updated_count = 0
-                for (topic_id, metric_type), count in topic_metrics.items():
-                    topic = session.query(TopicSearchResult)\
-                        .filter(TopicSearchResult.id == topic_id)\
-                        .first()
-
-                    if topic:
-                        if metric_type == 'likes':
-                            topic.monthly_likes = count
-                        elif metric_type == 'shares':
-                            topic.monthly_shares = count
-                        elif metric_type == 'comments':
-                            topic.monthly_comments = count
-                        updated_count += 1
-
-                session.commit()
-                logger.info(f"Updated monthly metrics for {updated_count} topics in {year}-{month}")
-                return updated_count
+            updated_count = self._aggregate_period(start_date, end_date, 'monthly')
+            logger.info(f"Updated monthly metrics for {updated_count} topics in {year}-{month}")
+            return updated_count
 
         except Exception as e:
             logger.error(f"Error aggregating monthly metrics: {e}")
@@ -130,45 +92,285 @@ class EngagementAggregationService:
             start_date = datetime(year, 1, 1)
             end_date = datetime(year + 1, 1, 1)
 
+            updated_count = self._aggregate_period(start_date, end_date, 'yearly')
+            logger.info(f"Updated yearly metrics for {updated_count} topics in {year}")
+            return updated_count
+
+        except Exception as e:
+            logger.error(f"Error aggregating yearly metrics: {e}")
+            return 0
+
+    def _supports_update_from(self) -> bool:
+        dialect = self.storage.engine.dialect
+        if dialect.name == 'sqlite':
+            return sqlite3.sqlite_version_info >= (3, 33, 0)
+        return dialect.name in ('postgresql', 'mysql', 'mariadb', 'mssql')
+
+    def _aggregate_period(self, start_date: datetime, end_date: datetime, period: str) -> int:
+        """Sum raw metrics per (topic_id, metric_type) in SQL and write them to the '<period>_*' columns"""
+        def raw_totals(metric_type: str) -> Optional[Select]:
+            # Only the monthly partitions overlapping the period are scanned
+            metrics = self.storage.metric_store.select_metrics(start_date, end_date, lambda table: [
+                table.c.timestamp >= start_date,
+                table.c.timestamp < end_date,
+                table.c.metric_type == metric_type
+            ])
+            if metrics is None:
+                return None
+            return select(
+                metrics.c.topic_id.label('topic_id'),
+                func.sum(metrics.c.count).label('total')
+            ).group_by(metrics.c.topic_id)
+
+        return self._write_period_totals(period, raw_totals)
+
+    def _write_period_totals(self, period: str, totals_for: Callable[[str], Optional[Select]]) -> int:
+        """Write per-topic totals into the '<period>_<metric type>' columns of TopicSearchResult
+
+        totals_for(metric_type) selects (topic_id, total) rows, or returns None
+        when there is nothing to write for that type. Returns the number
+        of (topic, metric type) totals written; topics without a total for a type
+        keep their previous value.
+        """
+        with self.storage.SessionLocal() as session:
+            updated_count = 0
+            for metric_type in self.METRIC_TYPES:
+                totals = totals_for(metric_type)
+                if totals is None:
+                    continue
+                column = f"{period}_{metric_type}"
+
+                if self._supports_update_from():
+                    # UPDATE ... FROM (SELECT topic_id, total ...)
+                    subquery = totals.subquery()
+                    result = session.execute(
+                        update(TopicSearchResult)
+                        .where(TopicSearchResult.id == subquery.c.topic_id)
+                        .values({getattr(TopicSearchResult, column): subquery.c.total})
+                        .execution_options(synchronize_session=False)
+                    )
+                    updated_count += result.rowcount
+                    continue
+
+                # Fallback: read the totals, then chunked executemany UPDATEs
+                params = [
+                    {'topic_key': topic_id, 'total': total}
+                    for topic_id, total in session.execute(totals).all()
+                ]
+                statement = update(TopicSearchResult.__table__)\
+                    .where(TopicSearchResult.__table__.c.id == bindparam('topic_key'))\
+                    .values({column: bindparam('total')})
+                chunk_size = self.storage.bulk_chunk_size
+                for start in range(0, len(params), chunk_size):
+                    result = session.connection().execute(statement, params[start:start + chunk_size])
+                    updated_count += max(result.rowcount, 0)
+
+            session.commit()
+            return updated_count
+
+    def rollup_new_metrics(self) -> int:
+        """Fold engagement metrics added since the last run into the daily, monthly and yearly rollups
+
+        Each monthly partition keeps its own id watermark, so only rows above it
+        are read, grouped per topic, metric type and day. Monthly deltas are
+        derived from the daily deltas and yearly from monthly, and everything is
+        added to the stored totals in one transaction together with the new
+        watermarks. Returns the number of metric rows folded.
+
+        Overlapping runs (the scheduler and the aggregate API, or several
+        processes) are safe: each watermark is advanced only if it still holds
+        the value this run started from, otherwise the run rolls back and
+        leaves the rows to the one that got there first.
+
+        Ids are handed out before commit on server databases, so a row with a
+        lower id can become visible after the watermark has passed it. There,
+        only rows created more than ROLLUP_SAFETY_LAG_SECONDS ago are folded,
+        leaving in-flight transactions that long to commit. SQLite serializes
+        writers, so its ids become visible in order and no lag is applied.
+        """
+        try:
+            partitions = self.storage.metric_store.partitions()
+            lag_seconds = 0 if self.storage.engine.dialect.name == 'sqlite' else Config.ROLLUP_SAFETY_LAG_SECONDS
+            settled_before = datetime.utcnow() - timedelta(seconds=lag_seconds)
+            self._ensure_watermarks([table.name for table in partitions])
             with self.storage.SessionLocal() as session:
-                # Get all engagement metrics for the year
-                metrics = session.query(EngagementMetrics)\
-                    .filter(EngagementMetrics.timestamp >= start_date)\
-                    .filter(EngagementMetrics.timestamp < end_date)\
-                    .all()
-
-                # Group by topic and metric type
-                topic_metrics = {}
-                for metric in metrics:
-                    key = (metric.topic_id, metric.metric_type)
-                    if key not in topic_metrics:
-                        topic_metrics[key] = 0
-                    topic_metrics[key] += metric.count
-
-                # Update topic search results with yearly aggregates
-                updated_count = 0
-                for (topic_id, metric_type), count in topic_metrics.items():
-                    topic = session.query(TopicSearchResult)\
-                        .filter(TopicSearchResult.id == topic_id)\
-                        .first()
-
-                    if topic:
-                        if metric_type == 'likes':
-                            topic.yearly_likes = count
-                        elif metric_type == 'shares':
-                            topic.yearly_shares = count
-                        elif metric_type == 'comments':
-                            topic.yearly_comments = count
-                        updated_count += 1
+                last_ids = dict(session.execute(
+                    select(RollupWatermark.name, RollupWatermark.last_id)
+                    .where(RollupWatermark.name.in_([table.name for table in partitions]))
+                ).all())
+
+                rows = []
+                new_marks: Dict[str, int] = {}
+                for table in partitions:
+                    last_id = last_ids.get(table.name, 0)
+
+                    settled = [table.c.id > last_id]
+                    if lag_seconds:
+                        settled.append(table.c.created_at < settled_before)
+                    max_id = session.execute(select(func.max(table.c.id)).where(*settled)).scalar()
+                    if max_id is None:
+                        continue
+
+                    day = func.date(table.c.timestamp)
+                    rows.extend(session.execute(
+                        select(
+                            table.c.topic_id,
+                            table.c.metric_type,
+                            day.label('day'),
+                            func.sum(table.c.count),
+                            func.count()
+                        ).where(table.c.id > last_id, table.c.id <= max_id)
+                        .group_by(table.c.topic_id, table.c.metric_type, day)
+                    ).all())
+                    new_marks[table.name] = max_id
+
+                if not new_marks:
+                    return 0
+
+                now = datetime.utcnow()
+                rollup_rows, folded_count = self._rollup_deltas(rows, now)
+
+                # Advance each watermark only from the value read above. A concurrent
+                # run that already moved it leaves nothing to match, and this run backs
+                # off before adding its deltas, so no row is ever counted twice.
+                for name, max_id in new_marks.items():
+                    result = session.execute(
+                        update(RollupWatermark)
+                        .where(RollupWatermark.name == name, RollupWatermark.last_id == last_ids.get(name, 0))
+                        .values(last_id=max_id, updated_at=now)
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount != 1:
+                        session.rollback()
+                        logger.info(f"Skipped engagement rollup: {name} was rolled up concurrently")
+                        return 0
+
+                self.storage.bulk_upsert(
+                    session, EngagementRollup, rollup_rows,
+                    key_columns=('topic_id', 'metric_type', 'period', 'period_start'),
+                    increment_columns=('total',)
+                )
+                session.commit()
 
+                logger.info(f"Rolled up {folded_count} new engagement metrics into {len(rollup_rows)} rollups")
+                return folded_count
+
+        except Exception as e:
+            logger.error(f"Error rolling up engagement metrics: {e}")
+            return 0
+
+    def _ensure_watermarks(self, names: List[str]) -> None:
+        """Insert a zero watermark for every partition that has none yet
+
+        Runs in its own transaction so rollups only ever update existing
+        watermark rows. A row inserted concurrently by another run is fine.
+        """
+        with self.storage.SessionLocal() as session:
+            existing = set(session.scalars(select(RollupWatermark.name).where(RollupWatermark.name.in_(names))))
+            missing = [name for name in names if name not in existing]
+            if not missing:
+                return
+            session.add_all(RollupWatermark(name) for name in missing)
+            try:
                 session.commit()
-                logger.info(f"Updated yearly metrics for {updated_count} topics in {year}")
-                return updated_count
+            except IntegrityError:
+                session.rollback()
+
+    def _rollup_deltas(self, rows: List[Tuple], now: datetime) -> Tuple[List[Dict[str, Any]], int]:
+        """Daily, monthly and yearly rollup rows from (topic, type, day, sum, count) groups
+
+        Returns the rollup rows and the number of metric rows they cover.
+        """
+        daily: Dict[Tuple[int, str, datetime], int] = defaultdict(int)
+        folded_count = 0
+        for topic_id, metric_type, day_value, total, row_count in rows:
+            daily[(topic_id, metric_type, _parse_day(day_value))] += total or 0
+            folded_count += row_count
+
+        monthly: Dict[Tuple[int, str, datetime], int] = defaultdict(int)
+        for (topic_id, metric_type, start), total in daily.items():
+            monthly[(topic_id, metric_type, period_start('monthly', start))] += total
+
+        yearly: Dict[Tuple[int, str, datetime], int] = defaultdict(int)
+        for (topic_id, metric_type, start), total in monthly.items():
+            yearly[(topic_id, metric_type, period_start('yearly', start))] += total
+
+        rollup_rows = [
+            {
+                'topic_id': topic_id,
+                'metric_type': metric_type,
+                'period': period,
+                'period_start': start,
+                'total': total,
+                'updated_at': now
+            }
+            for period, deltas in (('daily', daily), ('monthly', monthly), ('yearly', yearly))
+            for (topic_id, metric_type, start), total in deltas.items()
+        ]
+        return rollup_rows, folded_count
+
+    def apply_rollups(self, period: str, date: datetime) -> int:
+        """Copy the rollup totals of the period containing a date into the '<period>_*' topic columns"""
+        try:
+            start = period_start(period, date)
+
+            def rollup_totals(metric_type: str) -> Select:
+                return select(
+                    EngagementRollup.topic_id.label('topic_id'),
+                    EngagementRollup.total.label('total')
+                ).where(
+                    EngagementRollup.period == period,
+                    EngagementRollup.period_start == start,
+                    EngagementRollup.metric_type == metric_type
+                )
+
+            updated_count = self._write_period_totals(period, rollup_totals)
+            logger.info(f"Applied {period} rollups for {updated_count} topics from {start.date()}")
+            return updated_count
 
         except Exception as e:
-            logger.error(f"Error aggregating yearly metrics: {e}")
+            logger.error(f"Error applying {period} rollups: {e}")
             return 0
 
+    def run_incremental_aggregation(self, period: str, date: datetime) -> int:
+        """Fold new metrics into the rollups, then refresh the topic columns for one period"""
+        self.rollup_new_metrics()
+        return self.apply_rollups(period, date)
+
+    def _summary_rows(self, topic: TopicSearchResult, now: datetime, periods: Tuple[str, ...] = PERIODS,
+                      date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Summary rows for a topic's current aggregate columns
+
+        One row per requested period, bounded by the period containing date
+        (default: now).
+        """
+        date = date or now
+        day_start = period_start('daily', date)
+        month_start = period_start('monthly', date)
+        year_start = period_start('yearly', date)
+        bounds = {
+            'daily': (day_start, day_start + timedelta(days=1) - timedelta(microseconds=1)),
+            'monthly': (month_start, (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)),
+            'yearly': (year_start, year_start.replace(month=12, day=31, hour=23, minute=59, second=59, microsecond=999999))
+        }
+        return [
+            {
+                'topic': topic.topic,
+                'category': topic.category,
+                'period': period,
+                'period_start': start,
+                'period_end': end,
+                'total_likes': getattr(topic, f"{period}_likes") or 0,
+                'total_shares': getattr(topic, f"{period}_shares") or 0,
+                'total_comments': getattr(topic, f"{period}_comments") or 0,
+                'avg_engagement_score': topic.engagement_score or 0.0,
+                'peak_engagement_time': topic.engagement_timestamp,
+                'updated_at': now
+            }
+            for period, (start, end) in bounds.items()
+            if period in periods
+        ]
+
     def update_topic_engagement_summary(self, topic_id: int) -> bool:
         """Update pre-computed engagement summary for a topic"""
         try:
@@ -180,78 +382,82 @@ class EngagementAggregationService:
                 if not topic:
                     return False
 
-                # Calculate daily summary
-                daily_summary = EngagementSummary(
-                    topic=topic.topic,
-                    category=topic.category,
-                    period='daily',
-                    period_start=datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0),
-                    period_end=datetime.utcnow().replace(hour=23, minute=59, second=59, microsecond=999999),
-                    total_likes=topic.daily_likes,
-                    total_shares=topic.daily_shares,
-                    total_comments=topic.daily_comments,
-                    avg_engagement_score=topic.engagement_score,
-                    peak_engagement_time=topic.engagement_timestamp
-                )
-
-                # Calculate monthly summary
-                monthly_summary = EngagementSummary(
-                    topic=topic.topic,
-                    category=topic.category,
-                    period='monthly',
-                    period_start=datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0),
-                    period_end=(datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0) + timedelta(days=32)).replace(day=1) - timedelta(days=1),
-                    total_likes=topic.monthly_likes,
-                    total_shares=topic.monthly_shares,
-                    total_comments=topic.monthly_comments,
-                    avg_engagement_score=topic.engagement_score,
-                    peak_engagement_time=topic.engagement_timestamp
-                )
+                # Upsert summaries on (topic, category, period, period_start)
+                rows = self._summary_rows(topic, datetime.utcnow())
 
-                # Calculate yearly summary
-                yearly_summary = EngagementSummary(
-                    topic=topic.topic,
-                    category=topic.category,
-                    period='yearly',
-                    period_start=datetime.utcnow().replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0),
-                    period_end=datetime.utcnow().replace(month=12, day=31, hour=23, minute=59, second=59, microsecond=999999),
-                    total_likes=topic.yearly_likes,
-                    total_shares=topic.yearly_shares,
-                    total_comments=topic.yearly_comments,
-                    avg_engagement_score=topic.engagement_score,
-                    peak_engagement_time=topic.engagement_timestamp
-                )
+            if not self.storage.save_engagement_summaries(rows):
+                return False
 
-                # Upsert summaries
-                session.merge(daily_summary)
-                session.merge(monthly_summary)
-                session.merge(yearly_summary)
-                session.commit()
-
-                logger.info(f"Updated engagement summaries for topic: {topic.topic}")
-                return True
+            logger.info(f"Updated engagement summaries for topic: {topic.topic}")
+            return True
 
         except Exception as e:
             logger.error(f"Error updating topic engagement summary: {e}")
             return False
 
-    def batch_update_summaries(self, period: str, start_date: datetime, end_date: datetime) -> int:
-        """Batch update engagement summaries for a date range"""
+    def batch_update_summaries(self, period: str, start_date: datetime, end_date: datetime,
+                               chunk_size: Optional[int] = None) -> int:
+        """Recompute one period's engagement summaries for every topic with engagement in a date range
+
+        Only the summaries of the given period are written, for the period
+        containing end_date. Topics are streamed by one query, ordered so that
+        repeated search results for a topic are adjacent and the most recent one
+        wins, and their summaries are upserted chunk by chunk in a single
+        transaction.
+        """
+        if period not in self.PERIODS:
+            logger.error(f"Unknown summary period: {period}")
+            return 0
+
+        chunk_size = chunk_size or Config.SUMMARY_BATCH_CHUNK_SIZE
+        columns = [
+            TopicSearchResult.topic,
+            TopicSearchResult.category,
+            TopicSearchResult.engagement_score,
+            TopicSearchResult.engagement_timestamp
+        ] + [getattr(TopicSearchResult, f"{period}_{metric_type}") for metric_type in self.METRIC_TYPES]
+        query = select(*columns)\
+            .where(TopicSearchResult.engagement_timestamp >= start_date)\
+            .where(TopicSearchResult.engagement_timestamp <= end_date)\
+            .order_by(TopicSearchResult.topic, TopicSearchResult.category, TopicSearchResult.engagement_timestamp)\
+            .execution_options(yield_per=chunk_size)
+
         try:
+            now = datetime.utcnow()
+            updated_count = 0
             with self.storage.SessionLocal() as session:
-                # Get all topics that have engagement data in the period
-                topics = session.query(TopicSearchResult)\
-                    .filter(TopicSearchResult.engagement_timestamp >= start_date)\
-                    .filter(TopicSearchResult.engagement_timestamp <= end_date)\
-                    .all()
-
-                updated_count = 0
-                for topic in topics:
-                    if self.update_topic_engagement_summary(topic.id):
-                        updated_count += 1
-
-                logger.info(f"Batch updated {updated_count} engagement summaries for period {period}")
-                return updated_count
+                pending = []
+                previous_key = None
+
+                def flush() -> int:
+                    rows = [
+                        row for topic in pending
+                        for row in self._summary_rows(topic, now, periods=(period,), date=end_date)
+                    ]
+                    self.storage.bulk_upsert(
+                        session, EngagementSummary, rows,
+                        key_columns=SUMMARY_KEY_COLUMNS,
+                        update_columns=SUMMARY_VALUE_COLUMNS
+                    )
+                    flushed = len(pending)
+                    pending.clear()
+                    return flushed
+
+                for topic in session.execute(query):
+                    key = (topic.topic, topic.category)
+                    if key == previous_key:
+                        pending[-1] = topic
+                        continue
+                    if len(pending) >= chunk_size:
+                        updated_count += flush()
+                    pending.append(topic)
+                    previous_key = key
+
+                updated_count += flush()
+                session.commit()
+
+            logger.info(f"Batch updated {updated_count} engagement summaries for period {period}")
+            return updated_count
 
         except Exception as e:
             logger.error(f"Error batch updating summaries: {e}")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Shared SQLAlchemy engines for trending storage
+"""
+
+import logging
+import threading
+from typing import Dict
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+def _is_memory_sqlite(url) -> bool:
+    return url.database in (None, '', ':memory:') or url.query.get('mode') == 'memory'
+
+def _configure_sqlite(engine: Engine, wal: bool) -> None:
+    """Apply connection pragmas so readers are not blocked by the scheduler's writes"""
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if wal:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={int(Config.SQLITE_MMAP_SIZE)}")
+            # Negative cache_size is in KiB rather than pages
+            cursor.execute(f"PRAGMA cache_size=-{int(Config.SQLITE_CACHE_SIZE_KB)}")
+            cursor.execute(f"PRAGMA busy_timeout={int(Config.SQLITE_BUSY_TIMEOUT_MS)}")
+        finally:
+            cursor.close()
+
+def create_storage_engine(database_url: str) -> Engine:
+    """Create an engine tuned for the database behind the URL"""
+    url = make_url(database_url)
+
+    if url.get_backend_name() == 'sqlite':
+        engine = create_engine(
+            url,
+            echo=False,
+            connect_args={
+                'check_same_thread': False,  # Sessions hop between scheduler and request threads
+                'timeout': Config.SQLITE_BUSY_TIMEOUT_MS / 1000.0
+            }
+        )
+        _configure_sqlite(engine, wal=not _is_memory_sqlite(url))
+        return engine
+
+    return create_engine(
+        url,
+        echo=False,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
+
+def get_engine(database_url: str) -> Engine:
+    """Get the process-wide engine for a database URL, creating it on first use"""
+    key = make_url(database_url).render_as_string(hide_password=False)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_storage_engine(database_url)
+            _engines[key] = engine
+            logger.info(f"Created database engine for {make_url(database_url)}")
+        return engine
+
+def dispose_engines() -> None:
+    """Close the connection pools of every shared engine"""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
@@ -40,6 +40,10 @@ class XTrendingDetector:
     def __init__(self):
         self.base_detector = BaseXTrendingDetector()
 
+    def warm_up(self) -> None:
+        """Start a browser for the scheduled scrapes in the background"""
+        self.base_detector.warm_up()
+
     def get_trending_data(self) -> List[XTrendingData]:
         """Get trending data from X.com"""
         try:
@@ -6,7 +6,7 @@ Database models for trending topic search results
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Index, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Index, Boolean, UniqueConstraint
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -50,17 +50,23 @@ class TopicSearchResult(Base):
     def __init__(self, topic: str, category: str, score: float, engagement_score: float,
                  frequency: int = 0, engagement_trend: str = 'stable',
                  time_analysis: Optional[str] = None, related_topics: Optional[str] = None,
-                 source: str = 'x.com', search_timestamp: Optional[datetime] = None):
+                 source: str = 'x.com', search_timestamp: Optional[datetime] = None,
+                 likes_count: int = 0, shares_count: int = 0, comments_count: int = 0,
+                 engagement_timestamp: Optional[datetime] = None):
         self.topic = topic
         self.category = category
         self.score = score
         self.engagement_score = engagement_score
+        self.likes_count = likes_count
+        self.shares_count = shares_count
+        self.comments_count = comments_count
         self.frequency = frequency
         self.engagement_trend = engagement_trend
         self.time_analysis = time_analysis
         self.related_topics = related_topics
         self.source = source
         self.search_timestamp = search_timestamp or datetime.utcnow()
+        self.engagement_timestamp = engagement_timestamp or self.search_timestamp
 
 @dataclass
 class SearchJob(Base):
@@ -79,9 +85,20 @@ class SearchJob(Base):
     created_at: datetime = Column(DateTime, default=datetime.utcnow)
     updated_at: datetime = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    def __init__(self, job_id: str, job_type: str, status: str = 'pending',
+                 max_retries: int = 3):
+        self.job_id = job_id
+        self.job_type = job_type
+        self.status = status
+        self.max_retries = max_retries
+
 @dataclass
 class EngagementMetrics(Base):
-    """Detailed engagement metrics for time-series analysis"""
+    """Detailed engagement metrics for time-series analysis
+
+    Rows are stored in monthly engagement_metrics_YYYYMM partitions by
+    EngagementMetricStore; this table only holds rows awaiting migration.
+    """
     __tablename__ = 'engagement_metrics'
 
     id: int = Column(Integer, primary_key=True, autoincrement=True)
@@ -99,6 +116,44 @@ class EngagementMetrics(Base):
     )
 
 
+@dataclass
+class EngagementRollup(Base):
+    """Running engagement totals per topic, metric type and period, maintained incrementally"""
+    __tablename__ = 'engagement_rollups'
+
+    id: int = Column(Integer, primary_key=True, autoincrement=True)
+    topic_id: int = Column(Integer, ForeignKey('topic_search_results.id'), nullable=False)
+    metric_type: str = Column(String(50), nullable=False)  # 'likes', 'shares', 'comments'
+    period: str = Column(String(20), nullable=False)  # 'daily', 'monthly', 'yearly'
+    period_start: datetime = Column(DateTime, nullable=False)
+    total: int = Column(Integer, nullable=False, default=0)
+    updated_at: datetime = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('topic_id', 'metric_type', 'period', 'period_start', name='uq_rollup_key'),
+        Index('idx_rollup_period_start', 'period', 'period_start'),
+    )
+
+    def __init__(self, topic_id: int, metric_type: str, period: str, period_start: datetime, total: int = 0):
+        self.topic_id = topic_id
+        self.metric_type = metric_type
+        self.period = period
+        self.period_start = period_start
+        self.total = total
+
+@dataclass
+class RollupWatermark(Base):
+    """High-water mark of the last raw row folded into a rollup"""
+    __tablename__ = 'rollup_watermarks'
+
+    name: str = Column(String(100), primary_key=True)
+    last_id: int = Column(Integer, nullable=False, default=0)
+    updated_at: datetime = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __init__(self, name: str, last_id: int = 0):
+        self.name = name
+        self.last_id = last_id
+
 @dataclass
 class EngagementSummary(Base):
     """Pre-computed summaries for fast dashboard queries"""
@@ -125,14 +180,24 @@ class EngagementSummary(Base):
         Index('idx_topic_period', 'topic', 'period'),
         Index('idx_category_period', 'category', 'period'),
         Index('idx_period_range', 'period', 'period_start', 'period_end'),
+        # One summary per topic and period; summary writes upsert on this key
+        Index('uq_summary_key', 'topic', 'category', 'period', 'period_start', unique=True),
     )
 
-    def __init__(self, job_id: str, job_type: str, status: str = 'pending',
-                 max_retries: int = 3):
-        self.job_id = job_id
-        self.job_type = job_type
-        self.status = status
-        self.max_retries = max_retries
+    def __init__(self, topic: str, category: str, period: str, period_start: datetime,
+                 period_end: datetime, total_likes: int = 0, total_shares: int = 0,
+                 total_comments: int = 0, avg_engagement_score: float = 0.0,
+                 peak_engagement_time: Optional[datetime] = None):
+        self.topic = topic
+        self.category = category
+        self.period = period
+        self.period_start = period_start
+        self.period_end = period_end
+        self.total_likes = total_likes
+        self.total_shares = total_shares
+        self.total_comments = total_comments
+        self.avg_engagement_score = avg_engagement_score
+        self.peak_engagement_time = peak_engagement_time
 
 @dataclass
 class AISuggestion(Base):
@@ -197,4 +262,41 @@ class AISuggestionBatch(Base):
                  sources_used: Optional[str] = None):
         self.batch_id = batch_id
         self.status = status
-        self.sources_used = sources_used
\ No newline at end of file
+        self.sources_used = sources_used
+
+@dataclass
+class TrendingArticlesSnapshot(Base):
+    """Ready-to-serve trending articles built after each topic search"""
+    __tablename__ = 'trending_articles_snapshots'
+
+    id: int = Column(Integer, primary_key=True, autoincrement=True)
+    articles: str = Column(Text, nullable=False)  # JSON string of article dicts
+    etag: str = Column(String(64), nullable=False)
+    generated_at: datetime = Column(DateTime, nullable=False, index=True)
+
+    def __init__(self, articles: str, etag: str, generated_at: Optional[datetime] = None):
+        self.articles = articles
+        self.etag = etag
+        self.generated_at = generated_at or datetime.utcnow()
+
+@dataclass
+class TrendingHistoryEntry(Base):
+    """Scraped X.com trending data point kept for trend detection history"""
+    __tablename__ = 'trending_history'
+
+    id: int = Column(Integer, primary_key=True, autoincrement=True)
+    topic: str = Column(String(500), nullable=False)
+    frequency: int = Column(Integer, default=0)
+    engagement_score: float = Column(Float, default=0.0)
+    category: str = Column(String(100), nullable=False)
+    source: str = Column(String(100), default='x.com')
+    timestamp: datetime = Column(DateTime, nullable=False, index=True)
+
+    def __init__(self, topic: str, category: str, timestamp: datetime, frequency: int = 0,
+                 engagement_score: float = 0.0, source: str = 'x.com'):
+        self.topic = topic
+        self.category = category
+        self.timestamp = timestamp
+        self.frequency = frequency
+        self.engagement_score = engagement_score
+        self.source = source
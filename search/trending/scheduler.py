@@ -6,7 +6,7 @@ Topic search scheduler using APScheduler for continuous trending topic monitorin
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
@@ -16,14 +16,16 @@ from .detector import XTrendingDetector
 from .analyzer import XTrendingAnalyzer
 from .storage import TrendingStorage
 from .models import TopicSearchResult, SearchJob, EngagementMetrics
+from ..async_loop import run_async
 
 logger = logging.getLogger(__name__)
 
 class TopicSearchScheduler:
     """Scheduler for continuous topic search operations"""
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, search_manager=None):
         self.config = config or self._default_config()
+        self.search_manager = search_manager
         self.detector = XTrendingDetector()
         self.analyzer = XTrendingAnalyzer()
         self.storage = TrendingStorage(self.config.get('database_url', 'sqlite:///trending_data.db'))
@@ -54,7 +56,9 @@ class TopicSearchScheduler:
             'max_retries': 3,
             'retry_delay_minutes': 5,
             'cleanup_days': 30,
-            'max_results_per_search': 50
+            'rollup_interval_minutes': 15,
+            'max_results_per_search': 50,
+            'snapshot_articles': 5
         }
 
     def start(self) -> None:
@@ -84,8 +88,19 @@ class TopicSearchScheduler:
                 replace_existing=True
             )
 
+            # Fold new engagement metrics into the period rollups
+            self.scheduler.add_job(
+                func=self._run_engagement_rollup,
+                trigger=IntervalTrigger(minutes=self.config.get('rollup_interval_minutes', 15)),
+                id='engagement_rollup_job',
+                name='Engagement Rollup',
+                max_instances=1,
+                replace_existing=True
+            )
+
             # Start the scheduler
             self.scheduler.start()
+            self.detector.warm_up()
             self.running = True
             logger.info(f"Topic search scheduler started with {self.config['search_interval_hours']} hour intervals")
 
@@ -130,6 +145,7 @@ class TopicSearchScheduler:
 
             # Convert to database models and save
             search_results = []
+            result_metrics = []
             search_timestamp = datetime.utcnow()
 
             for analysis in analyses:
@@ -148,16 +164,19 @@ class TopicSearchScheduler:
 
                 search_results.append(result)
 
-                # Also save engagement metrics for time-series analysis
-                self._save_engagement_metrics(result)
+                # Also collect engagement metrics for time-series analysis
+                result_metrics.append(self._build_engagement_metrics(result))
 
-            # Save results
-            saved_count = self.storage.save_search_results(search_results)
+            # Save results and their metrics in one transaction
+            saved_count, metrics_count = self.storage.save_search_run(search_results, result_metrics)
 
             # Update job status to completed
             self.storage.update_job_status(job_id, 'completed')
 
-            logger.info(f"Topic search completed successfully. Saved {saved_count} results.")
+            logger.info(f"Topic search completed successfully. Saved {saved_count} results and {metrics_count} metrics.")
+
+            # Rebuild the dashboard's ready-to-serve articles from the fresh topics
+            self._refresh_articles_snapshot()
 
         except Exception as e:
             logger.error(f"Error during topic search: {e}")
@@ -169,11 +188,55 @@ class TopicSearchScheduler:
             job = self.storage.get_pending_jobs()  # This is a simplification; should get specific job
             # In a real implementation, you'd track retry logic here
 
+    def _refresh_articles_snapshot(self) -> None:
+        """Search the top trending topics and persist a trending articles snapshot"""
+        if not self.search_manager:
+            return
+
+        try:
+            limit = self.config.get('snapshot_articles', 5)
+            topics = self.storage.get_top_trending_topics(limit=limit, hours=24)
+            if not topics:
+                logger.info("No trending topics available for articles snapshot")
+                return
+
+            topic_scores = {topic.topic: int(topic.score * 100) for topic in topics}
+            topic_articles = run_async(
+                self.search_manager.search_topics(list(topic_scores), max_results=3, limit=limit)
+            )
+
+            articles = [
+                {
+                    "title": result.title,
+                    "url": result.url,
+                    "description": result.snippet,
+                    "source": result.source,
+                    "topic": topic,
+                    "score": topic_scores[topic]
+                }
+                for topic, result in topic_articles
+            ]
+            self.storage.save_articles_snapshot(articles)
+        except Exception as e:
+            logger.error(f"Error refreshing trending articles snapshot: {e}")
+
+    def _run_engagement_rollup(self) -> None:
+        """Fold engagement metrics saved since the last run into the period rollups"""
+        try:
+            folded_count = self.storage.run_incremental_rollup()
+            if folded_count:
+                logger.info(f"Rolled up {folded_count} new engagement metrics")
+        except Exception as e:
+            logger.error(f"Error rolling up engagement metrics: {e}")
+
     def _cleanup_old_data(self) -> None:
         """Clean up old search data"""
         try:
             logger.info("Starting cleanup of old search data")
-            deleted_count = self.storage.cleanup_old_data(self.config['cleanup_days'])
+            deleted_count = self.storage.cleanup_old_data(
+                self.config['cleanup_days'],
+                metrics_days=self.config.get('metrics_retention_days')
+            )
             logger.info(f"Cleaned up {deleted_count} old records")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -232,46 +295,21 @@ class TopicSearchScheduler:
         except Exception as e:
             logger.error(f"Failed to trigger manual search: {e}")
             return False
-    def _save_engagement_metrics(self, topic_result: TopicSearchResult) -> None:
-        """Save engagement metrics for time-series analysis"""
-        try:
-            # Create engagement metrics for each type
-            metrics = []
 
-            # Likes metric
-            if topic_result.likes_count > 0:
-                metrics.append(EngagementMetrics(
-                    topic_id=topic_result.id,
-                    metric_type='likes',
-                    count=topic_result.likes_count,
-                    timestamp=topic_result.engagement_timestamp,
-                    period='daily'
-                ))
-
-            # Shares metric
-            if topic_result.shares_count > 0:
-                metrics.append(EngagementMetrics(
-                    topic_id=topic_result.id,
-                    metric_type='shares',
-                    count=topic_result.shares_count,
-                    timestamp=topic_result.engagement_timestamp,
-                    period='daily'
-                ))
-
-            # Comments metric
-            if topic_result.comments_count > 0:
+    def _build_engagement_metrics(self, topic_result: TopicSearchResult) -> List[EngagementMetrics]:
+        """Build engagement metrics for time-series analysis; topic_id is set when the result is saved"""
+        metrics = []
+        counts = (
+            ('likes', topic_result.likes_count),
+            ('shares', topic_result.shares_count),
+            ('comments', topic_result.comments_count)
+        )
+        for metric_type, count in counts:
+            if count and count > 0:
                 metrics.append(EngagementMetrics(
-                    topic_id=topic_result.id,
-                    metric_type='comments',
-                    count=topic_result.comments_count,
+                    metric_type=metric_type,
+                    count=count,
                     timestamp=topic_result.engagement_timestamp,
                     period='daily'
                 ))
-
-            # Save metrics if any exist
-            if metrics:
-                self.storage.save_engagement_metrics(metrics)
-                logger.info(f"Saved {len(metrics)} engagement metrics for topic: {topic_result.topic}")
-
-        except Exception as e:
-            logger.error(f"Error saving engagement metrics for topic {topic_result.topic}: {e}")
\ No newline at end of file
+        return metrics
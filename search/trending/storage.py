@@ -3,27 +3,65 @@
 Database storage layer for trending topic search results
 """
 
+import hashlib
 import json
 import logging
+import threading
 from datetime import datetime, timedelta, UTC
-from typing import List, Optional, Dict
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple
+from sqlalchemy import and_, delete, func, insert, inspect, select, update, Column, Integer, String, Float, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from .models import TopicSearchResult, SearchJob, EngagementMetrics, EngagementSummary, AISuggestion, AISuggestionBatch, Base
+from ..config import Config
+from .database import get_engine
+from .timeseries import EngagementMetricStore
+from .models import TopicSearchResult, SearchJob, EngagementMetrics, EngagementSummary, EngagementRollup, RollupWatermark, AISuggestion, AISuggestionBatch, TrendingArticlesSnapshot, TrendingHistoryEntry, Base
 
 logger = logging.getLogger(__name__)
 
+def _chunked(rows: Sequence[Dict[str, Any]], chunk_size: int) -> Iterator[Sequence[Dict[str, Any]]]:
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start:start + chunk_size]
+
+def model_to_row(instance: Base) -> Dict[str, Any]:
+    """Column values of an unsaved ORM instance, with column defaults applied, for Core inserts"""
+    row = {}
+    for column in instance.__table__.columns:
+        if column.primary_key and column.autoincrement:
+            continue
+        value = getattr(instance, column.key, None)
+        if value is None and column.default is not None:
+            # Core executemany needs the same keys in every row, so resolve Python-side defaults here
+            value = column.default.arg(None) if column.default.is_callable else column.default.arg
+        row[column.key] = value
+    return row
+
+# (id, decoded snapshot) of the latest trending articles snapshot per database URL,
+# shared by every TrendingStorage in the process
+_articles_snapshots: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_articles_snapshots_lock = threading.Lock()
+
+# Natural key of an engagement summary and the columns an upsert refreshes
+SUMMARY_KEY_COLUMNS = ('topic', 'category', 'period', 'period_start')
+SUMMARY_VALUE_COLUMNS = ('period_end', 'total_likes', 'total_shares', 'total_comments',
+                         'avg_engagement_score', 'peak_engagement_time')
+
 class TrendingStorage:
     """Database storage for trending topic data"""
 
-    def __init__(self, database_url: str = "sqlite:///trending_data.db"):
+    def __init__(self, database_url: str = "sqlite:///trending_data.db", bulk_chunk_size: int = 500):
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
+        self.bulk_chunk_size = bulk_chunk_size
+        self.engine = get_engine(database_url)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
         # Create tables
         Base.metadata.create_all(bind=self.engine)
+        self._ensure_summary_key()
+
+        # Engagement metrics live in monthly partitions
+        self.metric_store = EngagementMetricStore(self.engine, chunk_size=bulk_chunk_size)
+        self._migrate_legacy_metrics()
 
         # Initialize aggregation service
         try:
@@ -47,19 +85,139 @@ class TrendingStorage:
 
     def save_search_results(self, results: List[TopicSearchResult]) -> int:
         """Save multiple search results to database"""
-        saved_count = 0
         try:
             with self.SessionLocal() as session:
-                for result in results:
-                    session.add(result)
-                    saved_count += 1
+                self.bulk_insert(session, results)
                 session.commit()
-                logger.info(f"Saved {saved_count} search results")
-                return saved_count
+                logger.info(f"Saved {len(results)} search results")
+                return len(results)
         except Exception as e:
             logger.error(f"Error saving search results: {e}")
             return 0
 
+    def save_search_run(self, results: List[TopicSearchResult],
+                        metrics: List[List[EngagementMetrics]]) -> Tuple[int, int]:
+        """Save a run's results and each result's engagement metrics in one transaction
+
+        metrics[i] belongs to results[i]; their topic_id is filled in from the
+        generated result IDs. Returns (saved results, saved metrics).
+        """
+        try:
+            self.metric_store.ensure_partitions(
+                metric.timestamp for result_metrics in metrics for metric in result_metrics
+            )
+            with self.SessionLocal() as session:
+                result_ids = self.bulk_insert(session, results)
+
+                metric_rows = []
+                for result_id, result_metrics in zip(result_ids, metrics):
+                    for metric in result_metrics:
+                        metric.topic_id = result_id
+                        metric_rows.append(model_to_row(metric))
+                self.metric_store.insert_rows(session.connection(), metric_rows)
+
+                session.commit()
+                logger.info(f"Saved {len(results)} search results and {len(metric_rows)} engagement metrics")
+                return len(results), len(metric_rows)
+        except Exception as e:
+            logger.error(f"Error saving search run: {e}")
+            return 0, 0
+
+    def bulk_insert(self, session: Session, instances: List[Base], return_ids: bool = True) -> List[int]:
+        """Insert unsaved ORM instances of one model with chunked executemany
+
+        Generated primary keys are assigned back to the instances and returned in
+        order. Dialects that cannot return keys from executemany fall back to
+        flushing the instances through the ORM when IDs are needed.
+        """
+        if not instances:
+            return []
+
+        model = type(instances[0])
+        if return_ids and not self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            session.add_all(instances)
+            session.flush()
+            return [instance.id for instance in instances]
+
+        rows = [model_to_row(instance) for instance in instances]
+        ids: List[int] = []
+        for chunk in _chunked(rows, self.bulk_chunk_size):
+            if return_ids:
+                statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+                ids.extend(session.execute(statement, chunk).scalars().all())
+            else:
+                session.execute(insert(model), chunk)
+
+        for instance, generated_id in zip(instances, ids):
+            instance.id = generated_id
+        return ids
+
+    def bulk_upsert(self, session: Session, model: type, rows: List[Dict[str, Any]], key_columns: Sequence[str],
+                    update_columns: Sequence[str] = (), increment_columns: Sequence[str] = ()) -> int:
+        """Insert rows, or update the existing row with the same key columns
+
+        update_columns are overwritten and increment_columns are added to the
+        stored value. SQLite and Postgres use chunked INSERT ... ON CONFLICT DO
+        UPDATE against the key's unique constraint; other dialects update by key
+        and insert when nothing matched. Rows must have distinct keys.
+        """
+        if not rows:
+            return 0
+
+        table = model.__table__
+        dialect = self.engine.dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            if dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+            statement = dialect_insert(table)
+            set_ = {column: statement.excluded[column] for column in update_columns}
+            set_.update({column: table.c[column] + statement.excluded[column] for column in increment_columns})
+            if 'updated_at' in table.c and 'updated_at' in rows[0]:
+                set_.setdefault('updated_at', statement.excluded.updated_at)
+            statement = statement.on_conflict_do_update(index_elements=list(key_columns), set_=set_)
+
+            for chunk in _chunked(rows, self.bulk_chunk_size):
+                session.execute(statement, chunk)
+            return len(rows)
+
+        for row in rows:
+            values = {column: row[column] for column in update_columns}
+            values.update({column: table.c[column] + row[column] for column in increment_columns})
+            key = and_(*(table.c[column] == row[column] for column in key_columns))
+            if values:
+                matched = session.execute(update(table).where(key).values(values)).rowcount
+            else:
+                matched = session.execute(select(table.c[key_columns[0]]).where(key).limit(1)).first() is not None
+            if not matched:
+                session.execute(insert(table).values(row))
+        return len(rows)
+
+    def _ensure_summary_key(self) -> None:
+        """Add the engagement summary unique key to tables created before it existed
+
+        Duplicate summaries left behind by the old merge-based writer are
+        removed first, keeping the most recent row for each key.
+        """
+        try:
+            table = EngagementSummary.__table__
+            index = next(index for index in table.indexes if index.name == 'uq_summary_key')
+            existing = {item['name'] for item in inspect(self.engine).get_indexes(table.name)}
+            if index.name in existing:
+                return
+
+            latest = select(func.max(table.c.id)).group_by(*index.columns).subquery()
+            with self.engine.begin() as connection:
+                removed = connection.execute(
+                    delete(table).where(table.c.id.not_in(select(latest.c[0])))
+                ).rowcount
+                index.create(connection)
+            logger.info(f"Added engagement summary unique key, removed {removed} duplicate summaries")
+        except Exception as e:
+            logger.warning(f"Could not add engagement summary unique key: {e}")
+
     def get_recent_results(self, hours: int = 24, limit: int = 100) -> List[TopicSearchResult]:
         """Get recent search results within specified hours"""
         try:
@@ -107,21 +265,178 @@ class TrendingStorage:
             logger.error(f"Error getting top trending topics: {e}")
             return []
 
-    def cleanup_old_data(self, days: int = 30) -> int:
-        """Clean up old search results"""
+    def cleanup_old_data(self, days: int = 30, metrics_days: Optional[int] = None) -> int:
+        """Clean up old search results together with their engagement metrics and rollups
+
+        Search results older than days are deleted with their metrics and
+        rollups. Raw engagement metrics have their own, longer retention
+        (metrics_days, default ENGAGEMENT_METRICS_RETENTION_DAYS, never shorter
+        than days): monthly partitions that end before that cutoff are dropped
+        whole, which also removes the old metrics of topics that are still
+        live, so get_engagement_metrics_by_topic only reaches back that far.
+        Rollup totals are kept for live topics.
+        """
         try:
-            cutoff_time = datetime.now(UTC) - timedelta(days=days)
+            now = datetime.now(UTC).replace(tzinfo=None)
+            cutoff_time = now - timedelta(days=days)
+            metrics_days = max(days, metrics_days or Config.ENGAGEMENT_METRICS_RETENTION_DAYS)
+            dropped = self.metric_store.drop_partitions_before(now - timedelta(days=metrics_days))
+
             with self.SessionLocal() as session:
-                deleted_count = session.query(TopicSearchResult)\
-                    .filter(TopicSearchResult.search_timestamp < cutoff_time)\
-                    .delete()
+                old_topic_ids = select(TopicSearchResult.id)\
+                    .where(TopicSearchResult.search_timestamp < cutoff_time)\
+                    .scalar_subquery()
+                metric_count = self.metric_store.delete_topics(session.connection(), old_topic_ids)
+                session.execute(delete(EngagementRollup).where(EngagementRollup.topic_id.in_(old_topic_ids)))
+                if dropped:
+                    session.execute(delete(RollupWatermark).where(RollupWatermark.name.in_(dropped)))
+
+                deleted_count = session.execute(
+                    delete(TopicSearchResult).where(TopicSearchResult.search_timestamp < cutoff_time)
+                ).rowcount
                 session.commit()
-                logger.info(f"Cleaned up {deleted_count} old search results")
+                logger.info(f"Cleaned up {deleted_count} old search results and {metric_count} of their engagement metrics")
                 return deleted_count
         except Exception as e:
             logger.error(f"Error cleaning up old data: {e}")
             return 0
 
+    def _migrate_legacy_metrics(self) -> None:
+        """Move metrics from the unpartitioned engagement_metrics table into partitions
+
+        The moved rows get new ids, so the rollups are cleared together with
+        every watermark, including those of partitions that already existed,
+        and the next incremental rollup rebuilds them from all partitions.
+        """
+        try:
+            legacy = EngagementMetrics.__table__
+            with self.engine.connect() as connection:
+                if connection.execute(select(legacy.c.id).limit(1)).first() is None:
+                    return
+
+            if self.metric_store.migrate_legacy(legacy):
+                with self.SessionLocal() as session:
+                    session.execute(delete(EngagementRollup))
+                    session.execute(delete(RollupWatermark))
+                    session.commit()
+        except Exception as e:
+            logger.warning(f"Could not migrate engagement metrics into partitions: {e}")
+
+    # Trending history methods
+    def save_history_entries(self, entries: List[Dict[str, Any]]) -> int:
+        """Append trending history rows (topic, frequency, engagement_score, category, source, timestamp)"""
+        if not entries:
+            return 0
+        try:
+            with self.SessionLocal() as session:
+                session.execute(insert(TrendingHistoryEntry), entries)
+                session.commit()
+                return len(entries)
+        except Exception as e:
+            logger.error(f"Error saving trending history: {e}")
+            return 0
+
+    def load_history_entries(self, since: datetime) -> List[Dict[str, Any]]:
+        """Load trending history rows newer than a cutoff, oldest first"""
+        try:
+            with self.SessionLocal() as session:
+                rows = session.execute(
+                    select(
+                        TrendingHistoryEntry.topic,
+                        TrendingHistoryEntry.frequency,
+                        TrendingHistoryEntry.engagement_score,
+                        TrendingHistoryEntry.category,
+                        TrendingHistoryEntry.source,
+                        TrendingHistoryEntry.timestamp
+                    )
+                    .where(TrendingHistoryEntry.timestamp >= since)
+                    .order_by(TrendingHistoryEntry.timestamp)
+                ).mappings().all()
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error loading trending history: {e}")
+            return []
+
+    def delete_history_before(self, cutoff: datetime) -> int:
+        """Delete trending history rows older than a cutoff"""
+        try:
+            with self.SessionLocal() as session:
+                deleted_count = session.query(TrendingHistoryEntry)\
+                    .filter(TrendingHistoryEntry.timestamp < cutoff)\
+                    .delete()
+                session.commit()
+                return deleted_count
+        except Exception as e:
+            logger.error(f"Error deleting trending history: {e}")
+            return 0
+
+    # Trending articles snapshot methods
+    def save_articles_snapshot(self, articles: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Replace the trending articles snapshot with a freshly built one"""
+        try:
+            payload = json.dumps(articles, sort_keys=True)
+            etag = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+            snapshot = TrendingArticlesSnapshot(articles=payload, etag=etag)
+            with self.SessionLocal() as session:
+                session.add(snapshot)
+                session.flush()
+                # Only the latest snapshot is ever served
+                session.query(TrendingArticlesSnapshot)\
+                    .filter(TrendingArticlesSnapshot.id != snapshot.id)\
+                    .delete()
+                session.commit()
+                logger.info(f"Saved trending articles snapshot with {len(articles)} articles")
+                result = {
+                    'articles': articles,
+                    'etag': etag,
+                    'generated_at': snapshot.generated_at.isoformat()
+                }
+                with _articles_snapshots_lock:
+                    _articles_snapshots[self.database_url] = (snapshot.id, result)
+                return result
+        except Exception as e:
+            logger.error(f"Error saving trending articles snapshot: {e}")
+            return None
+
+    def get_latest_articles_snapshot(self, max_age_hours: int = 8) -> Optional[Dict[str, Any]]:
+        """Get the latest trending articles snapshot if it is recent enough
+
+        Every call looks up the id of the latest snapshot, so one saved by
+        another process is picked up immediately; its articles are only read
+        and decoded when that id differs from the copy cached in this process.
+        """
+        try:
+            cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+            with self.SessionLocal() as session:
+                latest_id = session.execute(
+                    select(TrendingArticlesSnapshot.id)
+                    .where(TrendingArticlesSnapshot.generated_at >= cutoff_time)
+                    .order_by(TrendingArticlesSnapshot.generated_at.desc())
+                    .limit(1)
+                ).scalar()
+                if latest_id is None:
+                    return None
+
+                with _articles_snapshots_lock:
+                    cached = _articles_snapshots.get(self.database_url)
+                if cached and cached[0] == latest_id:
+                    return cached[1]
+
+                snapshot = session.get(TrendingArticlesSnapshot, latest_id)
+                if not snapshot:
+                    return None
+                result = {
+                    'articles': json.loads(snapshot.articles),
+                    'etag': snapshot.etag,
+                    'generated_at': snapshot.generated_at.isoformat()
+                }
+                with _articles_snapshots_lock:
+                    _articles_snapshots[self.database_url] = (snapshot.id, result)
+                return result
+        except Exception as e:
+            logger.error(f"Error getting trending articles snapshot: {e}")
+            return None
+
     # SearchJob methods
     def create_search_job(self, job_id: str, job_type: str) -> Optional[SearchJob]:
         """Create a new search job"""
@@ -203,8 +518,9 @@ class TrendingStorage:
     def save_engagement_metric(self, metric: EngagementMetrics) -> bool:
         """Save an engagement metric to database"""
         try:
+            self.metric_store.ensure_partitions([metric.timestamp])
             with self.SessionLocal() as session:
-                session.add(metric)
+                self.metric_store.insert_rows(session.connection(), [model_to_row(metric)])
                 session.commit()
                 logger.info(f"Saved engagement metric: {metric.metric_type} for topic {metric.topic_id}")
                 return True
@@ -214,15 +530,13 @@ class TrendingStorage:
 
     def save_engagement_metrics(self, metrics: List[EngagementMetrics]) -> int:
         """Save multiple engagement metrics to database"""
-        saved_count = 0
         try:
+            self.metric_store.ensure_partitions(metric.timestamp for metric in metrics)
             with self.SessionLocal() as session:
-                for metric in metrics:
-                    session.add(metric)
-                    saved_count += 1
+                self.metric_store.insert_rows(session.connection(), [model_to_row(metric) for metric in metrics])
                 session.commit()
-                logger.info(f"Saved {saved_count} engagement metrics")
-                return saved_count
+                logger.info(f"Saved {len(metrics)} engagement metrics")
+                return len(metrics)
         except Exception as e:
             logger.error(f"Error saving engagement metrics: {e}")
             return 0
@@ -231,22 +545,56 @@ class TrendingStorage:
                                        start_date: datetime = None, end_date: datetime = None) -> List[EngagementMetrics]:
         """Get engagement metrics for a specific topic"""
         try:
-            with self.SessionLocal() as session:
-                query = session.query(EngagementMetrics).filter(EngagementMetrics.topic_id == topic_id)
-
+            def criteria(table):
+                clauses = [table.c.topic_id == topic_id]
                 if period:
-                    query = query.filter(EngagementMetrics.period == period)
+                    clauses.append(table.c.period == period)
                 if start_date:
-                    query = query.filter(EngagementMetrics.timestamp >= start_date)
+                    clauses.append(table.c.timestamp >= start_date)
                 if end_date:
-                    query = query.filter(EngagementMetrics.timestamp <= end_date)
+                    clauses.append(table.c.timestamp <= end_date)
+                return clauses
+
+            # Only the monthly partitions overlapping the range are read
+            metrics = self.metric_store.select_metrics(start_date, end_date, criteria)
+            if metrics is None:
+                return []
 
-                metrics = query.order_by(EngagementMetrics.timestamp).all()
-                return metrics
+            with self.SessionLocal() as session:
+                rows = session.execute(select(metrics).order_by(metrics.c.timestamp)).mappings().all()
+                return [self._metric_from_row(row) for row in rows]
         except Exception as e:
             logger.error(f"Error getting engagement metrics by topic: {e}")
             return []
 
+    @staticmethod
+    def _metric_from_row(row: Dict[str, Any]) -> EngagementMetrics:
+        metric = EngagementMetrics(
+            topic_id=row['topic_id'],
+            metric_type=row['metric_type'],
+            count=row['count'],
+            timestamp=row['timestamp'],
+            period=row['period']
+        )
+        metric.id = row['id']
+        metric.created_at = row['created_at']
+        return metric
+
+    def save_engagement_summaries(self, summaries: List[Dict[str, Any]]) -> int:
+        """Insert or update engagement summaries keyed by topic, category, period and period start"""
+        try:
+            with self.SessionLocal() as session:
+                count = self.bulk_upsert(
+                    session, EngagementSummary, summaries,
+                    key_columns=SUMMARY_KEY_COLUMNS,
+                    update_columns=SUMMARY_VALUE_COLUMNS
+                )
+                session.commit()
+                return count
+        except Exception as e:
+            logger.error(f"Error saving engagement summaries: {e}")
+            return 0
+
     def get_top_engaged_topics_by_period(self, period: str, metric: str = 'likes',
                                         limit: int = 10, category: str = None) -> List[Dict]:
         """Get top engaged topics by period and metric"""
@@ -389,7 +737,7 @@ class TrendingStorage:
             return 0
         if not date:
             date = datetime.now(UTC)
-        return self.aggregation_service.aggregate_daily_metrics(date)
+        return self.aggregation_service.run_incremental_aggregation('daily', date)
 
     def run_monthly_aggregation(self, year: int = None, month: int = None) -> int:
         """Run monthly aggregation for engagement metrics"""
@@ -400,7 +748,7 @@ class TrendingStorage:
             now = datetime.now(UTC)
             year = now.year
             month = now.month
-        return self.aggregation_service.aggregate_monthly_metrics(year, month)
+        return self.aggregation_service.run_incremental_aggregation('monthly', datetime(year, month, 1))
 
     def run_yearly_aggregation(self, year: int = None) -> int:
         """Run yearly aggregation for engagement metrics"""
@@ -409,7 +757,14 @@ class TrendingStorage:
             return 0
         if not year:
             year = datetime.now(UTC).year
-        return self.aggregation_service.aggregate_yearly_metrics(year)
+        return self.aggregation_service.run_incremental_aggregation('yearly', datetime(year, 1, 1))
+
+    def run_incremental_rollup(self) -> int:
+        """Fold engagement metrics added since the last rollup into the period totals"""
+        if self.aggregation_service is None:
+            logger.warning("Aggregation service not available")
+            return 0
+        return self.aggregation_service.rollup_new_metrics()
 
     def update_engagement_summaries(self, period: str, start_date: datetime = None, end_date: datetime = None) -> int:
         """Update engagement summaries for a date range"""
@@ -437,15 +792,12 @@ class TrendingStorage:
 
     def save_ai_suggestions(self, suggestions: List[AISuggestion]) -> int:
         """Save multiple AI suggestions to database"""
-        saved_count = 0
         try:
             with self.SessionLocal() as session:
-                for suggestion in suggestions:
-                    session.add(suggestion)
-                    saved_count += 1
+                self.bulk_insert(session, suggestions, return_ids=False)
                 session.commit()
-                logger.info(f"Saved {saved_count} AI suggestions")
-                return saved_count
+                logger.info(f"Saved {len(suggestions)} AI suggestions")
+                return len(suggestions)
         except Exception as e:
             logger.error(f"Error saving AI suggestions: {e}")
             return 0
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Month-partitioned time-series storage for engagement metrics
+"""
+
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, func, insert, inspect, select, union_all
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import ColumnElement, Subquery
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PREFIX = 'engagement_metrics_'
+_PARTITION_NAME = re.compile(rf'^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$')
+
+def partition_key(timestamp: datetime) -> Tuple[int, int]:
+    """(year, month) of the partition holding a timestamp"""
+    return timestamp.year, timestamp.month
+
+def partition_bounds(key: Tuple[int, int]) -> Tuple[datetime, datetime]:
+    """Start (inclusive) and end (exclusive) of a monthly partition"""
+    year, month = key
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+class EngagementMetricStore:
+    """Engagement metrics stored in one table per calendar month
+
+    The same layout is used on every dialect: engagement_metrics_YYYYMM tables
+    created on first write. Range queries only read the partitions overlapping
+    the range, and retention drops whole partitions instead of deleting rows.
+    Ids only increase within a partition, so each can carry its own watermark.
+
+    The partition list is cached and re-read from the catalog every
+    refresh_interval seconds, so reads may briefly miss partitions created by
+    other processes. Writes always create their partitions with checkfirst, so
+    they never rely on the cache.
+    """
+
+    def __init__(self, engine: Engine, chunk_size: int = 500, refresh_interval: float = 60.0):
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.refresh_interval = refresh_interval
+        self.metadata = MetaData()
+        self._tables: Dict[Tuple[int, int], Table] = {}
+        self._existing: set = set()
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def _table(self, key: Tuple[int, int]) -> Table:
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                name = f"{PARTITION_PREFIX}{key[0]:04d}{key[1]:02d}"
+                table = Table(
+                    name, self.metadata,
+                    Column('id', Integer, primary_key=True, autoincrement=True),
+                    Column('topic_id', Integer, nullable=False),
+                    Column('metric_type', String(50), nullable=False),
+                    Column('count', Integer, default=0),
+                    Column('timestamp', DateTime, nullable=False),
+                    Column('period', String(20), nullable=False),
+                    Column('created_at', DateTime, default=datetime.utcnow),
+                    Index(f'idx_{name}_topic_time', 'topic_id', 'metric_type', 'timestamp'),
+                    Index(f'idx_{name}_time', 'timestamp'),
+                    # Never reuse ids of deleted rows: rollup watermarks rely on them increasing
+                    sqlite_autoincrement=True
+                )
+                self._tables[key] = table
+            return table
+
+    def refresh(self) -> List[Tuple[int, int]]:
+        """Re-read which partitions exist, including ones created by other processes"""
+        keys = []
+        for name in inspect(self.engine).get_table_names():
+            match = _PARTITION_NAME.match(name)
+            if match:
+                keys.append((int(match.group(1)), int(match.group(2))))
+        with self._lock:
+            self._existing = set(keys)
+            self._refreshed_at = time.monotonic()
+        return sorted(keys)
+
+    def partitions(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Table]:
+        """Known partitions overlapping [start, end], oldest first"""
+        if time.monotonic() - self._refreshed_at > self.refresh_interval:
+            self.refresh()
+        with self._lock:
+            keys = sorted(self._existing)
+
+        tables = []
+        for key in keys:
+            partition_start, partition_end = partition_bounds(key)
+            if start is not None and partition_end <= start:
+                continue
+            if end is not None and partition_start > end:
+                continue
+            tables.append(self._table(key))
+        return tables
+
+    def ensure_partitions(self, timestamps: Iterable[datetime]) -> None:
+        """Create the partitions for the given timestamps in their own transaction
+
+        Call this before opening the transaction that inserts the rows, so a
+        rollback of that transaction never takes a partition with it. Each
+        partition is checked against the catalog rather than the cache, so one
+        dropped by another process is recreated.
+        """
+        keys = {partition_key(timestamp) for timestamp in timestamps}
+        if not keys:
+            return
+        with self.engine.begin() as connection:
+            for key in sorted(keys):
+                self._table(key).create(connection, checkfirst=True)
+        with self._lock:
+            self._existing.update(keys)
+
+    def insert_rows(self, connection: Connection, rows: List[Dict[str, Any]]) -> int:
+        """Insert metric rows into their monthly partitions with chunked executemany"""
+        by_partition: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+        for row in rows:
+            row = {key: value for key, value in row.items() if key != 'id'}
+            if row.get('created_at') is None:
+                row['created_at'] = datetime.utcnow()
+            if row.get('count') is None:
+                row['count'] = 0
+            by_partition.setdefault(partition_key(row['timestamp']), []).append(row)
+
+        for key, partition_rows in by_partition.items():
+            table = self._table(key)
+            # Usually a no-op after ensure_partitions; otherwise created in the caller's transaction
+            table.create(connection, checkfirst=True)
+            for start in range(0, len(partition_rows), self.chunk_size):
+                connection.execute(insert(table), partition_rows[start:start + self.chunk_size])
+        return len(rows)
+
+    def select_metrics(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                       criteria: Optional[Callable[[Table], Iterable[ColumnElement]]] = None) -> Optional[Subquery]:
+        """UNION ALL of the partitions overlapping [start, end], or None if there are none
+
+        Partitions are pruned by month only; criteria(table) returns the filters,
+        including exact timestamp bounds, applied inside each partition.
+        """
+        selects = []
+        for table in self.partitions(start, end):
+            statement = select(table)
+            if criteria is not None:
+                statement = statement.where(*criteria(table))
+            selects.append(statement)
+        if not selects:
+            return None
+        if len(selects) == 1:
+            return selects[0].subquery('engagement_metrics')
+        return union_all(*selects).subquery('engagement_metrics')
+
+    def drop_partitions_before(self, cutoff: datetime) -> List[str]:
+        """Drop every partition that ends on or before the cutoff"""
+        self.refresh()
+        dropped = []
+        for table in self.partitions(end=cutoff):
+            match = _PARTITION_NAME.match(table.name)
+            key = (int(match.group(1)), int(match.group(2)))
+            if partition_bounds(key)[1] > cutoff:
+                continue
+            with self.engine.begin() as connection:
+                table.drop(connection, checkfirst=True)
+            with self._lock:
+                self._existing.discard(key)
+            dropped.append(table.name)
+        if dropped:
+            logger.info(f"Dropped engagement metric partitions: {', '.join(dropped)}")
+        return dropped
+
+    def delete_topics(self, connection: Connection, topic_ids: Any) -> int:
+        """Delete the metrics of the given topics (ids or a select of ids) from every partition"""
+        deleted_count = 0
+        for table in self.partitions():
+            result = connection.execute(table.delete().where(table.c.topic_id.in_(topic_ids)))
+            deleted_count += max(result.rowcount, 0)
+        return deleted_count
+
+    def migrate_legacy(self, legacy: Table) -> int:
+        """Move rows of the unpartitioned metrics table into monthly partitions"""
+        with self.engine.connect() as connection:
+            first, last = connection.execute(
+                select(func.min(legacy.c.timestamp), func.max(legacy.c.timestamp))
+            ).one()
+        if first is None:
+            return 0
+
+        keys = []
+        key = partition_key(first)
+        while key <= partition_key(last):
+            keys.append(key)
+            key = (key[0] + 1, 1) if key[1] == 12 else (key[0], key[1] + 1)
+        self.ensure_partitions(partition_bounds(key)[0] for key in keys)
+
+        columns = ['topic_id', 'metric_type', 'count', 'timestamp', 'period', 'created_at']
+        moved_count = 0
+        with self.engine.begin() as connection:
+            for key in keys:
+                partition_start, partition_end = partition_bounds(key)
+                source = select(*(legacy.c[column] for column in columns)).where(
+                    legacy.c.timestamp >= partition_start, legacy.c.timestamp < partition_end
+                )
+                result = connection.execute(self._table(key).insert().from_select(columns, source))
+                moved_count += max(result.rowcount, 0)
+            connection.execute(legacy.delete())
+        logger.info(f"Moved {moved_count} engagement metrics into {len(keys)} monthly partitions")
+        return moved_count
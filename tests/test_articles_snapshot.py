@@ -0,0 +1,27 @@
+"""Trending articles snapshots shared between processes"""
+
+import json
+
+import pytest
+
+from search.trending.models import TrendingArticlesSnapshot
+from search.trending.storage import TrendingStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return TrendingStorage(f"sqlite:///{tmp_path / 'trending.db'}")
+
+
+def test_snapshot_saved_by_another_process_is_served(storage):
+    storage.save_articles_snapshot([{'url': 'https://example.com/first'}])
+    assert storage.get_latest_articles_snapshot()['articles'] == [{'url': 'https://example.com/first'}]
+
+    # Written straight to the database, bypassing this process's cached copy
+    with storage.SessionLocal() as session:
+        session.add(TrendingArticlesSnapshot(json.dumps([{'url': 'https://example.com/second'}]), 'second'))
+        session.commit()
+
+    snapshot = storage.get_latest_articles_snapshot()
+    assert snapshot['etag'] == 'second'
+    assert snapshot['articles'] == [{'url': 'https://example.com/second'}]
@@ -0,0 +1,54 @@
+"""Retention of search results and partitioned engagement metrics"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from search.trending.models import EngagementMetrics, TopicSearchResult
+from search.trending.storage import TrendingStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return TrendingStorage(f"sqlite:///{tmp_path / 'trending.db'}")
+
+
+def _metric(topic_id, timestamp, count=1):
+    return EngagementMetrics(topic_id=topic_id, metric_type='likes', count=count,
+                             timestamp=timestamp, period='hourly')
+
+
+def test_cleanup_keeps_metrics_of_live_topics_within_metric_retention(storage):
+    now = datetime.utcnow()
+    live = TopicSearchResult(topic='live', category='ai_coding', score=1.0, engagement_score=0.5,
+                             search_timestamp=now - timedelta(days=1))
+    storage.save_search_run([live], [[]])
+    storage.save_engagement_metrics([
+        _metric(live.id, now - timedelta(days=90)),
+        _metric(live.id, now - timedelta(days=1)),
+    ])
+
+    storage.cleanup_old_data(days=30)
+
+    assert len(storage.get_engagement_metrics_by_topic(live.id)) == 2
+
+
+def test_cleanup_drops_partitions_past_metric_retention(storage):
+    now = datetime.utcnow()
+    live = TopicSearchResult(topic='live', category='ai_coding', score=1.0, engagement_score=0.5,
+                             search_timestamp=now - timedelta(days=1))
+    old = TopicSearchResult(topic='old', category='ai_coding', score=1.0, engagement_score=0.5,
+                            search_timestamp=now - timedelta(days=45))
+    storage.save_search_run([live, old], [[], []])
+    storage.save_engagement_metrics([
+        _metric(live.id, now - timedelta(days=120)),
+        _metric(live.id, now - timedelta(days=1)),
+        _metric(old.id, now - timedelta(days=40)),
+    ])
+
+    assert storage.cleanup_old_data(days=30, metrics_days=60) == 1
+
+    # The live topic loses only metrics in partitions past the metric retention
+    remaining = storage.get_engagement_metrics_by_topic(live.id)
+    assert [metric.timestamp.date() for metric in remaining] == [(now - timedelta(days=1)).date()]
+    assert storage.get_engagement_metrics_by_topic(old.id) == []
@@ -0,0 +1,87 @@
+"""Incremental rollups of partitioned engagement metrics"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from search.trending.aggregation import EngagementAggregationService
+from search.trending.models import EngagementMetrics, EngagementRollup, TopicSearchResult
+from search.trending.storage import TrendingStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return TrendingStorage(f"sqlite:///{tmp_path / 'trending.db'}")
+
+
+def _seed(storage, counts):
+    now = datetime.utcnow()
+    topic = TopicSearchResult(topic='rollups', category='ai_coding', score=1.0, engagement_score=0.5,
+                              search_timestamp=now)
+    storage.save_search_run([topic], [[]])
+    storage.save_engagement_metrics([
+        EngagementMetrics(topic_id=topic.id, metric_type='likes', count=count,
+                          timestamp=now - timedelta(minutes=index), period='hourly')
+        for index, count in enumerate(counts)
+    ])
+    return topic
+
+
+def _yearly_total(storage, topic):
+    with storage.SessionLocal() as session:
+        return session.scalar(select(EngagementRollup.total).where(
+            EngagementRollup.topic_id == topic.id,
+            EngagementRollup.period == 'yearly'
+        ))
+
+
+def test_rollup_folds_each_row_once(storage):
+    topic = _seed(storage, [3, 4])
+    service = EngagementAggregationService(storage)
+
+    assert service.rollup_new_metrics() == 2
+    assert service.rollup_new_metrics() == 0
+    assert _yearly_total(storage, topic) == 7
+
+
+def test_overlapping_rollups_count_each_row_once(storage, monkeypatch):
+    topic = _seed(storage, [3, 4])
+    service = EngagementAggregationService(storage)
+
+    # Hold both runs after they have read the same watermark, then let them race to write
+    both_read = threading.Barrier(2, timeout=10)
+    rollup_deltas = service._rollup_deltas
+
+    def deltas_after_both_read(rows, now):
+        both_read.wait()
+        return rollup_deltas(rows, now)
+
+    monkeypatch.setattr(service, '_rollup_deltas', deltas_after_both_read)
+
+    folded = []
+    threads = [threading.Thread(target=lambda: folded.append(service.rollup_new_metrics())) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(folded) == [0, 2]
+    assert _yearly_total(storage, topic) == 7
+
+
+def test_legacy_migration_rebuilds_rollups_of_existing_partitions(storage, tmp_path):
+    topic = _seed(storage, [3, 4])
+    assert EngagementAggregationService(storage).rollup_new_metrics() == 2
+
+    # An older process still writing to the unpartitioned table during a rolling deploy
+    with storage.SessionLocal() as session:
+        session.add(EngagementMetrics(topic_id=topic.id, metric_type='likes', count=5,
+                                      timestamp=datetime.utcnow(), period='hourly'))
+        session.commit()
+
+    migrated = TrendingStorage(f"sqlite:///{tmp_path / 'trending.db'}")
+    EngagementAggregationService(migrated).rollup_new_metrics()
+
+    assert _yearly_total(migrated, topic) == 12
@@ -0,0 +1,37 @@
+"""Batch refresh of pre-computed engagement summaries"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from search.trending.aggregation import EngagementAggregationService
+from search.trending.models import EngagementSummary, TopicSearchResult
+from search.trending.storage import TrendingStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return TrendingStorage(f"sqlite:///{tmp_path / 'trending.db'}")
+
+
+def test_batch_update_writes_only_the_requested_period(storage):
+    end = datetime(2025, 3, 15, 12)
+    topic = TopicSearchResult(topic='summaries', category='ai_coding', score=1.0, engagement_score=0.5,
+                              search_timestamp=end, engagement_timestamp=end - timedelta(hours=1))
+    topic.monthly_likes = 7
+    storage.save_search_run([topic], [[]])
+
+    service = EngagementAggregationService(storage)
+    assert service.batch_update_summaries('monthly', end - timedelta(days=1), end) == 1
+
+    with storage.SessionLocal() as session:
+        summaries = session.scalars(select(EngagementSummary)).all()
+    assert [(summary.period, summary.period_start, summary.total_likes) for summary in summaries] == [
+        ('monthly', datetime(2025, 3, 1), 7)
+    ]
+
+
+def test_batch_update_rejects_unknown_period(storage):
+    now = datetime.utcnow()
+    assert EngagementAggregationService(storage).batch_update_summaries('weekly', now - timedelta(days=1), now) == 0
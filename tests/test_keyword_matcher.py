@@ -0,0 +1,31 @@
+"""Keyword matching of run-together trending hashtags"""
+
+import pytest
+
+from search.social.keyword_matcher import KeywordMatcher
+from search.social.taxonomy import get_taxonomy
+
+
+@pytest.mark.parametrize("topic, category", [
+    ("#AICoding", "ai_coding"),
+    ("#GitHubCopilot", "ai_coding"),
+    ("#Rustlang", "programming_languages"),
+    ("#webdev", "general_coding"),
+    ("#100DaysOfCode", "general_coding"),
+])
+def test_run_together_hashtags_are_coding_topics(topic, category):
+    assert get_taxonomy().match('x_topics', topic).category == category
+
+
+def test_hashtag_segments_match_keywords():
+    matcher = KeywordMatcher({'topics': ['ai', 'coding', 'code', 'github']})
+    assert matcher.find_keywords("#AICoding") == ['ai', 'coding']
+    assert matcher.find_keywords("#100DaysOfCode") == ['code']
+    assert matcher.find_keywords("#GitHubCopilot") == ['github']
+
+
+def test_word_boundaries_still_apply_outside_hashtags():
+    matcher = KeywordMatcher({'topics': ['ai', 'code']})
+    assert matcher.find_keywords("email the Encoder") == []
+    assert matcher.find_keywords("#email") == []
+    assert matcher.find_keywords("AI code") == ['ai', 'code']
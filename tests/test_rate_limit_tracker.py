@@ -0,0 +1,51 @@
+"""Per-endpoint rate-limit budgets of the async Twitter client"""
+
+import asyncio
+import time
+
+from search.social.twitter_async import RateLimitTracker
+
+
+def test_budget_restarts_from_the_limit_after_reset():
+    async def scenario():
+        tracker = RateLimitTracker()
+        tracker.update('/tweets', {'x-rate-limit-limit': '2', 'x-rate-limit-remaining': '0',
+                                   'x-rate-limit-reset': str(time.time() + 0.05)})
+
+        assert await tracker.acquire('/tweets', max_wait=1)
+        assert tracker.status()['/tweets']['remaining'] == 1
+        assert await tracker.acquire('/tweets', max_wait=1)
+        # The new window is spent again and its reset has already passed
+        assert tracker.status()['/tweets']['remaining'] == 0
+
+    asyncio.run(scenario())
+
+
+def test_unknown_budget_lets_one_request_through_until_headers_arrive():
+    async def scenario():
+        tracker = RateLimitTracker()
+        assert await tracker.acquire('/tweets', max_wait=1)
+
+        queued = asyncio.create_task(tracker.acquire('/tweets', max_wait=1))
+        await asyncio.sleep(0.05)
+        assert not queued.done()
+
+        tracker.update('/tweets', {'x-rate-limit-limit': '10', 'x-rate-limit-remaining': '9'})
+        assert await queued
+        assert tracker.status()['/tweets']['remaining'] == 8
+
+    asyncio.run(scenario())
+
+
+def test_queued_request_probes_when_the_first_reports_nothing():
+    async def scenario():
+        tracker = RateLimitTracker()
+        assert await tracker.acquire('/tweets', max_wait=1)
+
+        queued = asyncio.create_task(tracker.acquire('/tweets', max_wait=1))
+        await asyncio.sleep(0.05)
+        tracker.release('/tweets')
+        assert await queued
+        assert tracker.status()['/tweets']['remaining'] is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,40 @@
+"""Search result cache lookups from coroutines"""
+
+import asyncio
+import threading
+
+from search.cache import MemoryCacheBackend, SearchCache
+
+
+class ThreadRecordingBackend(MemoryCacheBackend):
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return super().get(key)
+
+
+def test_blocking_backend_is_called_off_the_event_loop():
+    backend = ThreadRecordingBackend()
+    cache = SearchCache(backend=backend)
+
+    assert asyncio.run(cache.get_async('missing')) is None
+    assert backend.threads and threading.main_thread() not in backend.threads
+    assert cache.stats()['misses'] == 1
+
+
+def test_backend_errors_count_as_misses():
+    class BrokenBackend(MemoryCacheBackend):
+        blocking = True
+
+        def get(self, key):
+            raise ConnectionError('cache unreachable')
+
+    cache = SearchCache(backend=BrokenBackend())
+
+    assert asyncio.run(cache.get_async('key')) is None
+    assert cache.stats()['misses'] == 1